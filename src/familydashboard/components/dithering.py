@@ -1,12 +1,259 @@
 """Floyd-Steinberg dithering for Spectra E6 e-ink display with text preservation."""
 
+import numba
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from typing import Tuple, List, Optional
+from PIL import Image, ImageDraw
+from typing import Tuple, Optional
 import logging
 
+from familydashboard.components.fonts import get_font
+
 logger = logging.getLogger(__name__)
 
+# Inverse colormap resolution: channels are quantized to 6 bits for the lookup table
+_LUT_BITS = 6
+_LUT_SHIFT = 8 - _LUT_BITS
+
+# Band layout for the parallel dither kernel
+_BAND_HEIGHT = 64
+_BAND_OVERLAP = 2
+
+
+def _build_palette_lut(palette: np.ndarray) -> np.ndarray:
+    """Precompute the nearest palette index for every quantized RGB triple.
+
+    Each channel is reduced to _LUT_BITS bits, giving a (2**_LUT_BITS)**3 entry
+    table indexed by ``(r >> _LUT_SHIFT) << 2*_LUT_BITS | (g >> _LUT_SHIFT) << _LUT_BITS | (b >> _LUT_SHIFT)``.
+
+    Args:
+        palette: Array of palette colors
+
+    Returns:
+        Flat uint8 array of palette indices
+    """
+    levels = np.arange(1 << _LUT_BITS, dtype=np.float32) * (1 << _LUT_SHIFT) + (1 << _LUT_SHIFT) / 2
+    r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+    grid = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+
+    # |x - c|^2 = |x|^2 + |c|^2 - 2 x.c, and |x|^2 is the same for every palette
+    # color, so the argmin only needs |c|^2 - 2 x.c (one matrix product)
+    palette = palette.astype(np.float32)
+    palette_sqnorm = (palette * palette).sum(axis=1)
+    scores = palette_sqnorm[None, :] - 2.0 * (grid @ palette.T)
+    return scores.argmin(axis=1).astype(np.uint8)
+
+
+@numba.njit(cache=True, fastmath=True)
+def _preserve_index_kernel(img: np.ndarray, palette: np.ndarray, black_threshold: float,
+                           white_threshold: float, tolerance: float, black_idx: int,
+                           white_idx: int) -> np.ndarray:
+    """Find the pixels that are kept without dithering.
+
+    Run once per image ahead of error diffusion, so the dither loop only has to
+    branch on a lookup. The thresholds are passed in as arguments rather than read
+    from the class, since subclasses (see OptimizedE6Dithering) override them per
+    instance.
+
+    Args:
+        img: Contiguous uint8 RGB array
+        palette: Contiguous float32 array of palette colors
+        black_threshold: Pixels with all channels at or below this are kept black
+        white_threshold: Pixels with all channels at or above this are kept white
+        tolerance: Allowed distance for an exact palette match
+        black_idx: Palette index of black
+        white_idx: Palette index of white
+
+    Returns:
+        int8 array holding the palette index of each preserved pixel, -1 elsewhere
+    """
+    height, width = img.shape[0], img.shape[1]
+    n_colors = palette.shape[0]
+    tolerance_sq = tolerance * tolerance
+    preserve_idx = np.full((height, width), -1, dtype=np.int8)
+
+    for y in range(height):
+        for x in range(width):
+            r = img[y, x, 0]
+            g = img[y, x, 1]
+            b = img[y, x, 2]
+
+            if r <= black_threshold and g <= black_threshold and b <= black_threshold:
+                preserve_idx[y, x] = black_idx
+            elif r >= white_threshold and g >= white_threshold and b >= white_threshold:
+                preserve_idx[y, x] = white_idx
+            else:
+                for k in range(n_colors):
+                    dr = palette[k, 0] - r
+                    dg = palette[k, 1] - g
+                    db = palette[k, 2] - b
+                    if dr * dr + dg * dg + db * db <= tolerance_sq:
+                        preserve_idx[y, x] = k
+                        break
+
+    return preserve_idx
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fs_dither_band(img: np.ndarray, preserve_idx: np.ndarray, palette: np.ndarray, lut: np.ndarray,
+                    warmup_start: int, start: int, stop: int,
+                    palette_indices: np.ndarray, counts: np.ndarray):
+    """Floyd-Steinberg error diffusion over a horizontal band of rows.
+
+    Error is diffused into two working rows (the current row and the one below)
+    rather than into the full image, so the input is never modified. Rows in
+    [warmup_start, start) are diffused only to prime the error buffers and are
+    not written; error leaving the last row of the band is dropped.
+
+    Args:
+        img: Contiguous uint8 RGB array (not modified)
+        preserve_idx: Palette index of each pixel kept without dithering, -1 elsewhere
+            (see _preserve_index_kernel)
+        palette: Contiguous float32 array of palette colors
+        lut: Nearest palette index table from _build_palette_lut
+        warmup_start: First row to diffuse
+        start: First row whose output is written
+        stop: One past the last row of the band
+        palette_indices: Output palette index array, written for rows [start, stop)
+        counts: Per-color pixel counts, incremented for rows [start, stop)
+    """
+    width = img.shape[1]
+
+    # Working rows: pixel values plus the error diffused into them so far, stored
+    # as one contiguous plane per channel so each channel is stride-1 in x
+    cur = np.empty((3, width), dtype=np.float32)
+    nxt = np.empty((3, width), dtype=np.float32)
+    if warmup_start < stop:
+        for x in range(width):
+            cur[0, x] = img[warmup_start, x, 0]
+            cur[1, x] = img[warmup_start, x, 1]
+            cur[2, x] = img[warmup_start, x, 2]
+
+    for y in range(warmup_start, stop):
+        has_next = y < stop - 1
+        emit = y >= start
+        if has_next:
+            for x in range(width):
+                nxt[0, x] = img[y + 1, x, 0]
+                nxt[1, x] = img[y + 1, x, 1]
+                nxt[2, x] = img[y + 1, x, 2]
+
+        for x in range(width):
+            # Preserved pixels take their color directly and diffuse no error
+            preserved_idx = preserve_idx[y, x]
+            if preserved_idx >= 0:
+                if emit:
+                    palette_indices[y, x] = preserved_idx
+                    counts[preserved_idx] += 1
+                continue
+
+            r = cur[0, x]
+            g = cur[1, x]
+            b = cur[2, x]
+
+            # Nearest palette color from the precomputed lookup table
+            ri = int(min(max(r, 0.0), 255.0)) >> _LUT_SHIFT
+            gi = int(min(max(g, 0.0), 255.0)) >> _LUT_SHIFT
+            bi = int(min(max(b, 0.0), 255.0)) >> _LUT_SHIFT
+            best_idx = lut[(ri << (2 * _LUT_BITS)) | (gi << _LUT_BITS) | bi]
+
+            if emit:
+                palette_indices[y, x] = best_idx
+                counts[best_idx] += 1
+
+            # Quantization error for diffusion
+            er = r - palette[best_idx, 0]
+            eg = g - palette[best_idx, 1]
+            eb = b - palette[best_idx, 2]
+
+            # Error below one LSB per channel can't change a neighbor's 8-bit
+            # value, so skip the scatter (common on flat palette-colored areas)
+            if abs(er) + abs(eg) + abs(eb) < 1.5:
+                continue
+
+            if x < width - 1:
+                # Right pixel: 7/16
+                cur[0, x + 1] += er * (7.0 / 16.0)
+                cur[1, x + 1] += eg * (7.0 / 16.0)
+                cur[2, x + 1] += eb * (7.0 / 16.0)
+
+            if has_next:
+                # Bottom pixel: 5/16
+                nxt[0, x] += er * (5.0 / 16.0)
+                nxt[1, x] += eg * (5.0 / 16.0)
+                nxt[2, x] += eb * (5.0 / 16.0)
+
+                if x > 0:
+                    # Bottom-left pixel: 3/16
+                    nxt[0, x - 1] += er * (3.0 / 16.0)
+                    nxt[1, x - 1] += eg * (3.0 / 16.0)
+                    nxt[2, x - 1] += eb * (3.0 / 16.0)
+
+                if x < width - 1:
+                    # Bottom-right pixel: 1/16
+                    nxt[0, x + 1] += er * (1.0 / 16.0)
+                    nxt[1, x + 1] += eg * (1.0 / 16.0)
+                    nxt[2, x + 1] += eb * (1.0 / 16.0)
+
+        # The row below becomes the current row
+        cur, nxt = nxt, cur
+
+
+@numba.njit(cache=True, fastmath=True)
+def _fs_dither_kernel(img: np.ndarray, preserve_idx: np.ndarray, palette: np.ndarray,
+                      lut: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Serial Floyd-Steinberg error diffusion over the whole image.
+
+    Args:
+        img: Contiguous uint8 RGB array (not modified)
+        preserve_idx: Palette index of each pixel kept without dithering, -1 elsewhere
+        palette: Contiguous float32 array of palette colors
+        lut: Nearest palette index table from _build_palette_lut
+
+    Returns:
+        Tuple of (palette index array, per-color pixel counts)
+    """
+    height, width = img.shape[0], img.shape[1]
+    palette_indices = np.zeros((height, width), dtype=np.uint8)
+    counts = np.zeros(palette.shape[0], dtype=np.int64)
+
+    _fs_dither_band(img, preserve_idx, palette, lut, 0, 0, height, palette_indices, counts)
+
+    return palette_indices, counts
+
+
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def _fs_dither_kernel_parallel(img: np.ndarray, preserve_idx: np.ndarray, palette: np.ndarray,
+                               lut: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Band-parallel Floyd-Steinberg error diffusion.
+
+    The image is split into bands of _BAND_HEIGHT rows that are dithered
+    independently across threads. Each band first re-diffuses the last
+    _BAND_OVERLAP rows of the band above it so error arriving at the seam is
+    approximated; the result is visually equivalent to serial dithering but not
+    bit-identical.
+
+    Args:
+        img: Contiguous uint8 RGB array (not modified)
+        preserve_idx: Palette index of each pixel kept without dithering, -1 elsewhere
+        palette: Contiguous float32 array of palette colors
+        lut: Nearest palette index table from _build_palette_lut
+
+    Returns:
+        Tuple of (palette index array, per-color pixel counts)
+    """
+    height, width = img.shape[0], img.shape[1]
+    n_bands = (height + _BAND_HEIGHT - 1) // _BAND_HEIGHT
+    palette_indices = np.zeros((height, width), dtype=np.uint8)
+    band_counts = np.zeros((n_bands, palette.shape[0]), dtype=np.int64)
+
+    for band in numba.prange(n_bands):
+        start = band * _BAND_HEIGHT
+        stop = min(start + _BAND_HEIGHT, height)
+        _fs_dither_band(img, preserve_idx, palette, lut, max(start - _BAND_OVERLAP, 0), start, stop,
+                        palette_indices, band_counts[band])
+
+    return palette_indices, band_counts.sum(axis=0)
+
 
 class SpectraE6Dithering:
     """Floyd-Steinberg dithering for Spectra E6 6-color e-ink display with text preservation."""
@@ -24,21 +271,44 @@ class SpectraE6Dithering:
     # Convert palette to numpy array for faster processing
     PALETTE_ARRAY = np.array(list(E6_PALETTE.values()), dtype=np.float32)
     PALETTE_NAMES = list(E6_PALETTE.keys())
+    BLACK_INDEX = PALETTE_NAMES.index('black')
+    WHITE_INDEX = PALETTE_NAMES.index('white')
 
     # Thresholds for preserving black and white
     BLACK_THRESHOLD = 30   # Pixels darker than this are kept as pure black
     WHITE_THRESHOLD = 225  # Pixels brighter than this are kept as pure white
 
-    def __init__(self, preserve_bw: bool = True, bw_tolerance: float = 10.0):
+    # Error diffusion implementations accepted by the backend argument
+    BACKENDS = ('pil', 'numba', 'numba_parallel')
+
+    def __init__(self, preserve_bw: bool = True, bw_tolerance: float = 10.0, backend: str = 'pil',
+                 save_palette_debug: bool = False):
         """Initialize the dithering processor.
 
         Args:
             preserve_bw: Whether to preserve black and white pixels without dithering
             bw_tolerance: Tolerance for exact color matching (0 = exact match only)
+            backend: 'pil' for Pillow's C Floyd-Steinberg with preserved pixels masked
+                around it, 'numba' for the JIT kernel that skips diffusion from
+                preserved pixels entirely, or 'numba_parallel' for the same kernel
+                run over horizontal bands on multiple threads
+            save_palette_debug: Whether process_dashboard also writes a contrast-scaled
+                grayscale image of the palette indices for visual inspection
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown dithering backend {backend!r}, expected one of {self.BACKENDS}")
+
         self.palette_rgb = self.PALETTE_ARRAY.copy()
         self.preserve_bw = preserve_bw
         self.bw_tolerance = bw_tolerance
+        self.backend = backend
+        self.save_palette_debug = save_palette_debug
+        self._lut = _build_palette_lut(self.palette_rgb)
+
+        # Flat [r, g, b, ...] palette for 'P' mode images, and a palette image for Image.quantize
+        self._palette_flat = self.palette_rgb.astype(np.uint8).ravel().tolist()
+        self._pil_palette = Image.new('P', (1, 1))
+        self._pil_palette.putpalette(self._palette_flat)
 
     def is_exact_palette_match(self, pixel: np.ndarray, tolerance: float = 0.0) -> Tuple[bool, Optional[int], Optional[np.ndarray]]:
         """Check if a pixel exactly matches a palette color.
@@ -50,38 +320,40 @@ class SpectraE6Dithering:
         Returns:
             Tuple of (is_match, palette_index, palette_color) or (False, None, None)
         """
-        for idx, palette_color in enumerate(self.palette_rgb):
-            distance = np.sqrt(np.sum((palette_color - pixel) ** 2))
-            if distance <= tolerance:
-                return True, idx, palette_color
+        # Squared distance to every palette color at once (no sqrt needed)
+        diff = self.palette_rgb - pixel
+        distances = (diff * diff).sum(axis=1)
+        idx = int(distances.argmin())
+        if distances[idx] <= tolerance * tolerance:
+            return True, idx, self.palette_rgb[idx]
         return False, None, None
 
-    def should_preserve_pixel(self, pixel: np.ndarray) -> Tuple[bool, Optional[np.ndarray]]:
+    def should_preserve_pixel(self, pixel: np.ndarray) -> Tuple[bool, Optional[np.ndarray], Optional[int]]:
         """Check if a pixel should be preserved without dithering.
 
         Args:
             pixel: RGB pixel values
 
         Returns:
-            Tuple of (should_preserve, target_color) or (False, None)
+            Tuple of (should_preserve, target_color, palette_index) or (False, None, None)
         """
         if not self.preserve_bw:
-            return False, None
+            return False, None, None
 
-        # Check if it's near black
-        if np.all(pixel <= self.BLACK_THRESHOLD):
-            return True, np.array([0, 0, 0], dtype=np.float32)
+        # Check if it's near black (brightest channel at or below the threshold)
+        if max(pixel) <= self.BLACK_THRESHOLD:
+            return True, self.palette_rgb[self.BLACK_INDEX], self.BLACK_INDEX
 
-        # Check if it's near white
-        if np.all(pixel >= self.WHITE_THRESHOLD):
-            return True, np.array([255, 255, 255], dtype=np.float32)
+        # Check if it's near white (darkest channel at or above the threshold)
+        if min(pixel) >= self.WHITE_THRESHOLD:
+            return True, self.palette_rgb[self.WHITE_INDEX], self.WHITE_INDEX
 
         # Check for exact palette matches (with tolerance)
-        is_match, _, color = self.is_exact_palette_match(pixel, self.bw_tolerance)
+        is_match, idx, color = self.is_exact_palette_match(pixel, self.bw_tolerance)
         if is_match:
-            return True, color
+            return True, color, idx
 
-        return False, None
+        return False, None, None
 
     @staticmethod
     def find_nearest_palette_color(pixel: np.ndarray, palette: np.ndarray) -> Tuple[int, np.ndarray]:
@@ -94,12 +366,14 @@ class SpectraE6Dithering:
         Returns:
             Tuple of (palette index, palette RGB values)
         """
-        # Calculate Euclidean distance to each palette color
-        distances = np.sqrt(np.sum((palette - pixel) ** 2, axis=1))
+        # Squared Euclidean distance to each palette color (sqrt is monotonic,
+        # so it doesn't change the argmin)
+        diff = palette - pixel
+        distances = (diff * diff).sum(axis=1)
         nearest_idx = np.argmin(distances)
         return nearest_idx, palette[nearest_idx]
 
-    def floyd_steinberg_dither(self, image: Image.Image) -> Tuple[Image.Image, np.ndarray]:
+    def floyd_steinberg_dither(self, image: Image.Image) -> Tuple[Image.Image, np.ndarray, np.ndarray]:
         """Apply Floyd-Steinberg dithering to an image using E6 palette with text preservation.
 
         The Floyd-Steinberg algorithm distributes quantization error to neighboring pixels:
@@ -112,101 +386,114 @@ class SpectraE6Dithering:
             image: Input PIL Image
 
         Returns:
-            Tuple of (dithered image, palette index array)
+            Tuple of (dithered palette-mode image, palette index array, pixel count per palette color)
         """
         # Convert to RGB if necessary
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
-        # Convert to numpy array with float type for error diffusion
-        img_array = np.array(image, dtype=np.float32)
-        original_array = img_array.copy()  # Keep original for reference
-        height, width = img_array.shape[:2]
+        # The kernel reads the uint8 pixels directly; only two rows are held as float
+        img_array = np.ascontiguousarray(np.asarray(image))
 
-        # Create output arrays
-        dithered = np.zeros_like(img_array, dtype=np.uint8)
-        palette_indices = np.zeros((height, width), dtype=np.uint8)
+        # Decide up front which pixels skip dithering
+        preserve_idx = self._preserve_indices(img_array)
 
-        # Process each pixel
-        for y in range(height):
-            for x in range(width):
-                # Get current pixel
-                old_pixel = img_array[y, x].copy()
-
-                # Check if this pixel should be preserved (black/white/exact match)
-                should_preserve, preserved_color = self.should_preserve_pixel(original_array[y, x])
-
-                if should_preserve and preserved_color is not None:
-                    # Use the preserved color without dithering
-                    new_pixel = preserved_color
-                    # Find the palette index for this color
-                    palette_idx = 0
-                    for idx, pc in enumerate(self.palette_rgb):
-                        if np.allclose(pc, new_pixel, rtol=0, atol=1):
-                            palette_idx = idx
-                            break
-                    # No error diffusion for preserved pixels
-                    error = np.zeros(3, dtype=np.float32)
-                else:
-                    # Find nearest palette color normally
-                    palette_idx, new_pixel = self.find_nearest_palette_color(old_pixel, self.palette_rgb)
-                    # Calculate error for diffusion
-                    error = old_pixel - new_pixel
-
-                # Set output pixel
-                dithered[y, x] = new_pixel.astype(np.uint8)
-                palette_indices[y, x] = palette_idx
-
-                # Only distribute error if we didn't preserve the pixel
-                if not should_preserve:
-                    # Distribute error to neighboring pixels (Floyd-Steinberg coefficients)
-                    if x < width - 1:
-                        # Right pixel: 7/16
-                        img_array[y, x + 1] += error * (7.0 / 16.0)
-
-                    if y < height - 1:
-                        # Bottom pixel: 5/16
-                        img_array[y + 1, x] += error * (5.0 / 16.0)
-
-                        if x > 0:
-                            # Bottom-left pixel: 3/16
-                            img_array[y + 1, x - 1] += error * (3.0 / 16.0)
-
-                        if x < width - 1:
-                            # Bottom-right pixel: 1/16
-                            img_array[y + 1, x + 1] += error * (1.0 / 16.0)
-
-        # Convert back to PIL Image
-        dithered_image = Image.fromarray(dithered, mode='RGB')
-
-        return dithered_image, palette_indices
-
-    def analyze_color_distribution(self, image: Image.Image) -> dict:
+        if self.backend == 'pil':
+            palette_indices = self._quantize_with_pil(img_array, preserve_idx)
+            counts = np.bincount(palette_indices.ravel(), minlength=len(self.palette_rgb))
+        else:
+            kernel = _fs_dither_kernel_parallel if self.backend == 'numba_parallel' else _fs_dither_kernel
+            palette_indices, counts = kernel(
+                img_array, preserve_idx, np.ascontiguousarray(self.palette_rgb), self._lut)
+
+        # Wrap the indices as a palette image; no RGB buffer is built here,
+        # callers that need one can use dithered_image.convert('RGB')
+        dithered_image = Image.fromarray(palette_indices, mode='P')
+        dithered_image.putpalette(self._palette_flat)
+
+        return dithered_image, palette_indices, counts
+
+    def _preserve_indices(self, img_array: np.ndarray) -> np.ndarray:
+        """Map each pixel to the palette index it is preserved as.
+
+        Args:
+            img_array: Contiguous uint8 RGB array
+
+        Returns:
+            int8 array of palette indices for preserved pixels, -1 elsewhere
+        """
+        if not self.preserve_bw:
+            return np.full(img_array.shape[:2], -1, dtype=np.int8)
+
+        return _preserve_index_kernel(
+            img_array, self.palette_rgb, float(self.BLACK_THRESHOLD), float(self.WHITE_THRESHOLD),
+            float(self.bw_tolerance), self.BLACK_INDEX, self.WHITE_INDEX)
+
+    def _quantize_with_pil(self, img_array: np.ndarray, preserve_idx: np.ndarray) -> np.ndarray:
+        """Dither with Pillow's built-in Floyd-Steinberg quantizer.
+
+        Preserved pixels are snapped to their palette color before quantizing and
+        forced back to it afterwards, so error diffused into them can't flip them.
+
+        Args:
+            img_array: Contiguous uint8 RGB array
+            preserve_idx: Output of _preserve_indices
+
+        Returns:
+            Palette index array
+        """
+        preserved = preserve_idx >= 0
+        has_preserved = preserved.any()
+        if has_preserved:
+            img_array = img_array.copy()
+            img_array[preserved] = self.palette_rgb[preserve_idx[preserved]]
+
+        quantized = Image.fromarray(img_array, mode='RGB').quantize(
+            palette=self._pil_palette, dither=Image.Dither.FLOYDSTEINBERG)
+        # asarray skips the second copy np.array would make of Pillow's pixel
+        # bytes; the view is read-only, so only copy when patching it below
+        palette_indices = np.asarray(quantized)
+
+        if has_preserved:
+            palette_indices = palette_indices.copy()
+            palette_indices[preserved] = preserve_idx[preserved]
+
+        return palette_indices
+
+    def analyze_color_distribution(self, image: Image.Image,
+                                   palette_indices: Optional[np.ndarray] = None) -> dict:
         """Analyze which E6 colors will be used after dithering.
 
         Args:
             image: Original image to analyze
+            palette_indices: Palette index array from a previous dither of the image;
+                when given, colors are counted from it instead of dithering again
 
         Returns:
             Dictionary of color statistics
         """
-        # Apply dithering to get the color distribution
-        dithered_img, _ = self.floyd_steinberg_dither(image)
+        if palette_indices is not None:
+            # Single pass over the index plane
+            counts = np.bincount(np.ravel(palette_indices), minlength=len(self.palette_rgb))
+        else:
+            # Apply dithering to get the color distribution
+            _, _, counts = self.floyd_steinberg_dither(image)
+        return self.color_stats_from_counts(counts)
 
-        # Count colors in dithered image
-        img_array = np.array(dithered_img)
-        height, width = img_array.shape[:2]
-        total_pixels = height * width
+    def color_stats_from_counts(self, counts: np.ndarray) -> dict:
+        """Build color statistics from per-palette-color pixel counts.
 
-        color_counts = {}
-        for color_name, color_rgb in self.E6_PALETTE.items():
-            # Count pixels matching this color (with small tolerance for rounding)
-            mask = np.all(np.abs(img_array - color_rgb) < 2, axis=2)
-            count = np.sum(mask)
-            percentage = (count / total_pixels) * 100
-            color_counts[color_name] = (count, percentage)
+        Args:
+            counts: Pixel count for each palette color, as returned by floyd_steinberg_dither
 
-        return color_counts
+        Returns:
+            Dictionary mapping color name to (count, percentage)
+        """
+        total_pixels = max(int(counts.sum()), 1)
+        return {
+            color_name: (int(count), (count / total_pixels) * 100)
+            for color_name, count in zip(self.PALETTE_NAMES, counts)
+        }
 
     def create_preview_with_original(self, original_image: Image.Image, color_stats: dict) -> Image.Image:
         """Create a preview showing the ORIGINAL image with color statistics.
@@ -229,10 +516,7 @@ class SpectraE6Dithering:
         # Draw color distribution info
         draw = ImageDraw.Draw(preview)
 
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 14)
-        except:
-            font = ImageFont.load_default()
+        font = get_font(14)
 
         # Draw title
         draw.text((10, height + 5),
@@ -283,20 +567,10 @@ class SpectraE6Dithering:
 
         # Apply dithering (single pass)
         logger.info("Applying Floyd-Steinberg dithering with text preservation...")
-        dithered_image, palette_indices = self.floyd_steinberg_dither(input_image)
+        dithered_image, palette_indices, counts = self.floyd_steinberg_dither(input_image)
 
-        # Analyze the dithered image for statistics
-        logger.info("Analyzing color distribution...")
-        img_array = np.array(dithered_image)
-        height, width = img_array.shape[:2]
-        total_pixels = height * width
-
-        color_stats = {}
-        for color_name, color_rgb in self.E6_PALETTE.items():
-            mask = np.all(np.abs(img_array - color_rgb) < 2, axis=2)
-            count = np.sum(mask)
-            percentage = (count / total_pixels) * 100
-            color_stats[color_name] = (count, percentage)
+        # Color statistics come straight from the dither pass
+        color_stats = self.color_stats_from_counts(counts)
 
         # Create preview with ORIGINAL image and statistics
         preview = self.create_preview_with_original(input_image, color_stats)
@@ -305,19 +579,21 @@ class SpectraE6Dithering:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         dithered_path = output_path / f"dashboard_e6_dithered_{timestamp}.png"
-        dithered_image.save(dithered_path)
+        dithered_image.save(dithered_path, compress_level=1)
 
         preview_path = output_path / f"dashboard_e6_preview_{timestamp}.png"
-        preview.save(preview_path)
-
-        # Also save the palette index image for e-ink display driver
-        palette_path = output_path / f"dashboard_e6_palette_{timestamp}.png"
-        palette_indices_img = Image.fromarray((palette_indices * 42).astype(np.uint8), mode='L')  # Scale for visibility
-        palette_indices_img.save(palette_path)
+        preview.save(preview_path, compress_level=1)
 
         logger.info(f"Saved dithered image: {dithered_path}")
         logger.info(f"Saved preview image: {preview_path}")
-        logger.info(f"Saved palette indices: {palette_path}")
+
+        # The dithered image is palette-mode, so its pixel values already are the
+        # palette indices the e-ink driver needs; this copy is only for viewing
+        if self.save_palette_debug:
+            palette_path = output_path / f"dashboard_e6_palette_{timestamp}.png"
+            palette_indices_img = Image.fromarray((palette_indices * 42).astype(np.uint8), mode='L')  # Scale for visibility
+            palette_indices_img.save(palette_path)
+            logger.info(f"Saved palette index debug image: {palette_path}")
 
         return str(dithered_path), str(preview_path)
 
@@ -325,15 +601,19 @@ class SpectraE6Dithering:
 class OptimizedE6Dithering(SpectraE6Dithering):
     """Optimized dithering with enhanced text preservation."""
 
-    def __init__(self, preserve_text: bool = True, text_threshold: int = 40):
+    def __init__(self, preserve_text: bool = True, text_threshold: int = 40, backend: str = 'pil',
+                 save_palette_debug: bool = False):
         """Initialize optimized dithering.
 
         Args:
             preserve_text: Whether to preserve black/white text without dithering
             text_threshold: Threshold for text detection (higher = more aggressive preservation)
+            backend: Error diffusion backend ('pil', 'numba' or 'numba_parallel')
+            save_palette_debug: Whether to also save a viewable palette index image
         """
         # Always preserve black/white for text
-        super().__init__(preserve_bw=preserve_text, bw_tolerance=5.0)
+        super().__init__(preserve_bw=preserve_text, bw_tolerance=5.0, backend=backend,
+                         save_palette_debug=save_palette_debug)
         self.preserve_text = preserve_text
         self.text_threshold = text_threshold
 
@@ -351,34 +631,31 @@ class OptimizedE6Dithering(SpectraE6Dithering):
         Returns:
             Preprocessed image
         """
-        img_array = np.array(image, dtype=np.float32)
+        # Work on the uint8 pixels directly; the checks below only need integer math
+        img_array = np.array(image, dtype=np.uint8)
 
         # Don't enhance contrast for text areas
         # Just ensure blacks are black and whites are white
 
-        # Force near-black to pure black (text preservation)
-        black_mask = np.all(img_array <= self.BLACK_THRESHOLD, axis=2)
-        img_array[black_mask] = [0, 0, 0]
+        # Near-black becomes pure black (text preservation). Comparing the channel
+        # max/min gives the HxW mask directly, without an HxWx3 boolean temporary.
+        black_mask = img_array.max(axis=2) <= self.BLACK_THRESHOLD
 
-        # Force near-white to pure white (background preservation)
-        white_mask = np.all(img_array >= self.WHITE_THRESHOLD, axis=2)
-        img_array[white_mask] = [255, 255, 255]
+        # Near-white becomes pure white (background preservation)
+        white_mask = img_array.min(axis=2) >= self.WHITE_THRESHOLD
 
-        # For grays that aren't text, apply light processing
-        gray_mask = np.all(np.abs(img_array - img_array.mean(axis=2, keepdims=True)) < 20, axis=2)
-        gray_mask = gray_mask & ~black_mask & ~white_mask
+        # For grays that aren't text, apply light processing. A pixel is gray when
+        # every channel is within 20 of the mean, i.e. |3c - (r+g+b)| < 60.
+        channel_sum = img_array.sum(axis=2, dtype=np.int16)
+        deviation = np.abs(3 * img_array.astype(np.int16) - channel_sum[..., None])
+        gray_mask = np.all(deviation < 60, axis=2) & ~black_mask & ~white_mask
 
-        for y in range(img_array.shape[0]):
-            for x in range(img_array.shape[1]):
-                if gray_mask[y, x]:
-                    brightness = img_array[y, x].mean()
-                    # Push grays toward black or white for cleaner text
-                    if brightness < 128:
-                        img_array[y, x] = [0, 0, 0]
-                    else:
-                        img_array[y, x] = [255, 255, 255]
+        # Push grays toward black or white for cleaner text (mean < 128)
+        gray_dark = gray_mask & (channel_sum < 384)
+        img_array[black_mask | gray_dark] = 0
+        img_array[white_mask | (gray_mask & ~gray_dark)] = 255
 
-        return Image.fromarray(np.clip(img_array, 0, 255).astype(np.uint8), mode='RGB')
+        return Image.fromarray(img_array, mode='RGB')
 
     def smart_color_assignment(self, image: Image.Image) -> Image.Image:
         """Apply smart color assignment based on content type.
@@ -390,4 +667,4 @@ class OptimizedE6Dithering(SpectraE6Dithering):
             Image with colors reassigned for better E6 display
         """
         # Just return the image - color assignment is handled in preprocessing
-        return image
\ No newline at end of file
+        return image
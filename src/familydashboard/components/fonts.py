@@ -0,0 +1,43 @@
+"""Shared, cached font loading for dashboard components."""
+
+from PIL import ImageFont
+from functools import lru_cache
+
+DEFAULT_FONT_PATH = "/System/Library/Fonts/Helvetica.ttc"
+
+
+@lru_cache(maxsize=32)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (path, size) and share it across layouts.
+
+    Args:
+        path: Font file path
+        size: Font size in points
+
+    Returns:
+        Font object
+
+    Raises:
+        OSError: If the font file cannot be read
+    """
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=16)
+def get_font(size: int, path: str = DEFAULT_FONT_PATH) -> ImageFont.ImageFont:
+    """Load a font once per (size, path), falling back to Pillow's default font.
+
+    The fallback is sized too, so layouts keep their proportions on machines
+    without the TrueType font.
+
+    Args:
+        size: Font size in pixels
+        path: TrueType font file
+
+    Returns:
+        Font object
+    """
+    try:
+        return load_font(path, size)
+    except OSError:
+        return ImageFont.load_default(size)
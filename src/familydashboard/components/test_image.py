@@ -1,9 +1,46 @@
 """Generate a test image with gradients and colors for dithering demonstration."""
 
-from PIL import Image, ImageDraw
+import math
+
+import numba
+from PIL import Image
 import numpy as np
 
 
+@numba.njit(parallel=True, cache=True)
+def _render_sunset(out: np.ndarray, center_x: int, center_y: int, max_dist: float):
+    """Fill an HxWx3 uint8 buffer with the sunset gradient in a single pass.
+
+    Args:
+        out: Output RGB buffer, written in place
+        center_x: Sun center column
+        center_y: Sun center row
+        max_dist: Distance that maps to the outer edge of the gradient
+    """
+    height, width = out.shape[0], out.shape[1]
+    horizon = height // 2
+    for y in numba.prange(height):
+        dy2 = (y - center_y) ** 2
+        for x in range(width):
+            # Normalized distance from the sun
+            norm_dist = min(math.sqrt((x - center_x) ** 2 + dy2) / max_dist, 1.0)
+
+            if y < horizon:
+                # Sky colors
+                r = 255 * (1 - norm_dist * 0.3)
+                g = 200 * (1 - norm_dist * 0.4)
+                b = 100 + 155 * norm_dist
+            else:
+                # Ground colors
+                r = 100 * (1 - norm_dist * 0.5)
+                g = 150 * (1 - norm_dist * 0.3)
+                b = 80 * (1 - norm_dist * 0.4)
+
+            out[y, x, 0] = min(255, int(r))
+            out[y, x, 1] = min(255, int(g))
+            out[y, x, 2] = min(255, int(b))
+
+
 def create_test_pattern(width: int = 400, height: int = 300) -> Image.Image:
     """Create a test pattern with gradients and color patches.
 
@@ -14,30 +51,31 @@ def create_test_pattern(width: int = 400, height: int = 300) -> Image.Image:
     Returns:
         PIL Image with test pattern
     """
-    # Create base image
-    img = Image.new('RGB', (width, height), (255, 255, 255))
-    draw = ImageDraw.Draw(img)
+    # Build the pattern as a uint8 array and fill whole slices at once.
+    # ImageDraw rectangles include their end coordinates, so each band below
+    # covers one extra row/column that the next band then overwrites.
+    img_array = np.full((height, width, 3), 255, dtype=np.uint8)
 
     # Create color gradient bars (top section)
     gradient_height = height // 3
+    third = width // 3
+    two_thirds = 2 * width // 3
+    gradient_rows = slice(0, gradient_height + 1)
 
     # Red to white gradient
-    for x in range(width // 3):
-        intensity = int(255 * (x / (width // 3)))
-        color = (255, intensity, intensity)
-        draw.rectangle([x, 0, x + 1, gradient_height], fill=color)
+    ramp = (255 * (np.arange(third) / third)).astype(np.uint8)
+    img_array[gradient_rows, 0:third, 1] = ramp
+    img_array[gradient_rows, 0:third, 2] = ramp
 
     # Green to white gradient
-    for x in range(width // 3, 2 * width // 3):
-        intensity = int(255 * ((x - width // 3) / (width // 3)))
-        color = (intensity, 255, intensity)
-        draw.rectangle([x, 0, x + 1, gradient_height], fill=color)
+    ramp = (255 * (np.arange(two_thirds - third) / third)).astype(np.uint8)
+    img_array[gradient_rows, third:two_thirds, 0] = ramp
+    img_array[gradient_rows, third:two_thirds, 2] = ramp
 
     # Blue to white gradient
-    for x in range(2 * width // 3, width):
-        intensity = int(255 * ((x - 2 * width // 3) / (width // 3)))
-        color = (intensity, intensity, 255)
-        draw.rectangle([x, 0, x + 1, gradient_height], fill=color)
+    ramp = (255 * (np.arange(width - two_thirds) / third)).astype(np.uint8)
+    img_array[gradient_rows, two_thirds:width, 0] = ramp
+    img_array[gradient_rows, two_thirds:width, 1] = ramp
 
     # Middle section - color patches
     patch_y = gradient_height
@@ -53,20 +91,19 @@ def create_test_pattern(width: int = 400, height: int = 300) -> Image.Image:
         (128, 0, 255),    # Purple
     ]
 
-    for i, color in enumerate(colors):
-        x = i * patch_width
-        draw.rectangle([x, patch_y, x + patch_width, patch_y + patch_height], fill=color)
+    # One row of all six patches, broadcast down the band in a single store.
+    # The last patch is a column wider, matching its inclusive right edge.
+    widths = np.full(len(colors), patch_width)
+    widths[-1] += 1
+    patch_row = np.repeat(np.array(colors, dtype=np.uint8), widths, axis=0)[:width]
+    img_array[patch_y:patch_y + patch_height + 1, :len(patch_row)] = patch_row
 
     # Bottom section - grayscale gradient
     gray_y = patch_y + patch_height
-    gray_height = height - gray_y
-
-    for x in range(width):
-        gray_value = int(255 * (x / width))
-        color = (gray_value, gray_value, gray_value)
-        draw.rectangle([x, gray_y, x + 1, height], fill=color)
+    gray = (255 * (np.arange(width) / width)).astype(np.uint8)
+    img_array[gray_y:height] = gray[None, :, None]
 
-    return img
+    return Image.fromarray(img_array)
 
 
 def create_photo_like_image(width: int = 400, height: int = 300) -> Image.Image:
@@ -79,49 +116,51 @@ def create_photo_like_image(width: int = 400, height: int = 300) -> Image.Image:
     Returns:
         PIL Image with photo-like content
     """
-    # Create numpy array for smooth gradients
-    img_array = np.zeros((height, width, 3), dtype=np.uint8)
-
     # Create circular gradient (like a sunset)
     center_x, center_y = width // 2, height // 3
 
-    for y in range(height):
-        for x in range(width):
-            # Distance from center
-            dist = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-            max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
-
-            # Normalize distance
-            norm_dist = min(dist / max_dist, 1.0)
-
-            # Create sunset-like colors
-            if y < height // 2:
-                # Sky colors
-                r = int(255 * (1 - norm_dist * 0.3))  # Light orange to yellow
-                g = int(200 * (1 - norm_dist * 0.4))  # Orange to red
-                b = int(100 + 155 * norm_dist)        # Blue gradient
-            else:
-                # Ground colors
-                r = int(100 * (1 - norm_dist * 0.5))
-                g = int(150 * (1 - norm_dist * 0.3))
-                b = int(80 * (1 - norm_dist * 0.4))
-
-            img_array[y, x] = [min(255, r), min(255, g), min(255, b)]
-
-    # Add some "clouds" (white patches with soft edges)
-    for _ in range(3):
-        cloud_x = np.random.randint(width // 4, 3 * width // 4)
-        cloud_y = np.random.randint(height // 6, height // 3)
-        cloud_radius = np.random.randint(20, 40)
-
-        for y in range(max(0, cloud_y - cloud_radius), min(height, cloud_y + cloud_radius)):
-            for x in range(max(0, cloud_x - cloud_radius), min(width, cloud_x + cloud_radius)):
-                dist = np.sqrt((x - cloud_x) ** 2 + (y - cloud_y) ** 2)
-                if dist < cloud_radius:
-                    alpha = 1 - (dist / cloud_radius)
-                    alpha = alpha ** 2  # Soft edge
-                    current = img_array[y, x].astype(float)
-                    white = np.array([255, 255, 255])
-                    img_array[y, x] = (current * (1 - alpha) + white * alpha).astype(np.uint8)
+    max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
+    img_array = np.empty((height, width, 3), dtype=np.uint8)
+    _render_sunset(img_array, center_x, center_y, max_dist)
+
+    # Add some "clouds" (white patches with soft edges). Work buffers are
+    # sized for the largest cloud and sliced per cloud to avoid temporaries.
+    max_radius = 40
+    alpha_buf = np.empty((2 * max_radius, 2 * max_radius))
+    weight_buf = np.empty_like(alpha_buf)
+    region_buf = np.empty((2 * max_radius, 2 * max_radius, 3))
+
+    # Draw all cloud positions and sizes up front
+    n_clouds = 3
+    rng = np.random.default_rng()
+    cloud_xs = rng.integers(width // 4, 3 * width // 4, size=n_clouds)
+    cloud_ys = rng.integers(height // 6, height // 3, size=n_clouds)
+    cloud_radii = rng.integers(20, max_radius, size=n_clouds)
+
+    for cloud_x, cloud_y, cloud_radius in zip(cloud_xs, cloud_ys, cloud_radii):
+        # Blend white into the cloud's bounding box in one masked step
+        y0, y1 = max(0, cloud_y - cloud_radius), min(height, cloud_y + cloud_radius)
+        x0, x1 = max(0, cloud_x - cloud_radius), min(width, cloud_x + cloud_radius)
+        h, w = y1 - y0, x1 - x0
+        y, x = np.ogrid[y0:y1, x0:x1]
+
+        alpha = alpha_buf[:h, :w]
+        np.add((x - cloud_x) ** 2, (y - cloud_y) ** 2, out=alpha)
+        np.sqrt(alpha, out=alpha)
+        outside = alpha >= cloud_radius
+        np.divide(alpha, -cloud_radius, out=alpha)
+        alpha += 1
+        np.square(alpha, out=alpha)  # Soft edge
+        alpha[outside] = 0.0
+
+        weight = weight_buf[:h, :w]
+        np.subtract(1, alpha, out=weight)
+        alpha *= 255
+
+        region = region_buf[:h, :w]
+        np.copyto(region, img_array[y0:y1, x0:x1])
+        region *= weight[..., None]
+        region += alpha[..., None]
+        img_array[y0:y1, x0:x1] = region
 
     return Image.fromarray(img_array)
\ No newline at end of file
@@ -3,11 +3,38 @@
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from PIL import Image
-import io
+from PIL import Image, ImageDraw
+import math
 import numpy as np
-from typing import List, Tuple, Optional
+from datetime import datetime
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from typing import Dict, List, Tuple, Optional
+
+from familydashboard.components.fonts import get_font
+
+# Layout of the NumPy-rasterized simple graph, in pixels: left, top, right, bottom
+_FAST_MARGINS = (64, 10, 14, 30)
+_FAST_TICK_HOURS = (0, 6, 12, 18, 23)
+_FAST_TICK_LABELS = ('12am', '6am', '12pm', '6pm', '11pm')
+_GRID_COLOR = (176, 176, 176)
+
+
+def _nice_ticks(lo: float, hi: float, max_ticks: int = 5) -> np.ndarray:
+    """Pick round-number tick values inside [lo, hi].
+
+    Args:
+        lo: Lower axis limit
+        hi: Upper axis limit
+        max_ticks: Upper bound on the number of ticks
+
+    Returns:
+        Array of tick values
+    """
+    raw_step = max(hi - lo, 1e-9) / max_ticks
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+    return np.arange(math.ceil(lo / step) * step, hi, step)
 
 
 class TemperatureGraph:
@@ -25,9 +52,64 @@ class TemperatureGraph:
         self.height = height
         self.dpi = dpi
 
+        # Figures are built once per graph style and cleared between
+        # renders; figure construction dominates the cost of these small
+        # plots. The styles get separate figures because Axes.clear() keeps
+        # tick and grid styling, which would leak from one layout into the other.
+        self._figures: Dict[str, Tuple[Figure, Axes]] = {}
+        self._precip_ax: Optional[Axes] = None
+
+    def _get_axes(self, style: str) -> Tuple[Figure, Axes]:
+        """Return the cached figure and cleared axes for a graph style.
+
+        Args:
+            style: Key identifying which graph method is drawing
+
+        Returns:
+            Tuple of (figure, axes) ready to be drawn on
+        """
+        if style not in self._figures:
+            fig, ax = plt.subplots(figsize=(self.width / self.dpi, self.height / self.dpi),
+                                   dpi=self.dpi)
+            fig.patch.set_facecolor('white')
+            self._figures[style] = (fig, ax)
+            return fig, ax
+
+        fig, ax = self._figures[style]
+        if self._precip_ax is not None and self._precip_ax.figure is fig:
+            self._precip_ax.remove()
+            self._precip_ax = None
+
+        # tight_layout starts from the current subplot params, so restore
+        # the defaults to lay out the same way a fresh figure would
+        fig.subplots_adjust(**{
+            side: matplotlib.rcParams[f'figure.subplot.{side}']
+            for side in ('left', 'right', 'bottom', 'top')
+        })
+        ax.clear()
+        return fig, ax
+
+    @staticmethod
+    def _render(fig: Figure) -> Image.Image:
+        """Rasterize a figure straight from the Agg canvas.
+
+        Args:
+            fig: Figure to render
+
+        Returns:
+            RGB PIL Image of the figure
+        """
+        fig.canvas.draw()
+        width, height = fig.canvas.get_width_height()
+        # The canvas buffer is reused by the next draw of this cached figure, so
+        # an ndarray view of it would change under the caller. convert() makes
+        # the one copy out, dropping alpha on the way; paste needs an Image anyway.
+        return Image.frombuffer('RGBA', (width, height), fig.canvas.buffer_rgba(),
+                                'raw', 'RGBA', 0, 1).convert('RGB')
+
     def create_graph(self, hours: List[int], temperatures: List[float],
                     precipitation: Optional[List[float]] = None,
-                    unit: str = "°F") -> Image.Image:
+                    unit: str = "°F", now: Optional[datetime] = None) -> Image.Image:
         """Create a temperature graph with optional precipitation overlay.
 
         Args:
@@ -35,30 +117,34 @@ class TemperatureGraph:
             temperatures: List of temperatures for each hour
             precipitation: Optional list of precipitation probabilities (0-100)
             unit: Temperature unit string
+            now: Time used to mark the current hour (defaults to the current time)
 
         Returns:
             PIL Image object containing the graph
         """
-        # Create figure with specified size
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=self.dpi)
+        fig, ax = self._get_axes('full')
+
+        # Temperature extremes, found in a single pass and reused below
+        temps = np.asarray(temperatures, dtype=float)
+        max_idx = int(temps.argmax())
+        min_idx = int(temps.argmin())
+        max_temp = float(temps[max_idx])
+        min_temp = float(temps[min_idx])
 
         # Style the plot for e-ink display
         ax.set_facecolor('white')
-        fig.patch.set_facecolor('white')
 
         # Plot temperature line
         ax.plot(hours, temperatures, color='black', linewidth=2, marker='o',
                 markersize=4, markerfacecolor='white', markeredgecolor='black')
 
         # Fill under the curve with a light pattern
-        ax.fill_between(hours, temperatures, min(temperatures) - 5,
+        ax.fill_between(hours, temperatures, min_temp - 5,
                        alpha=0.1, color='black', hatch='///')
 
         # Add precipitation bars if provided
         if precipitation:
-            ax2 = ax.twinx()
+            ax2 = self._precip_ax = ax.twinx()
             # Create bar chart for precipitation
             bars = ax2.bar(hours, precipitation, alpha=0.3, color='gray',
                           width=0.8, label='Precip %')
@@ -85,11 +171,6 @@ class TemperatureGraph:
 
         # Add min/max annotations
         if temperatures:
-            max_temp = max(temperatures)
-            min_temp = min(temperatures)
-            max_idx = temperatures.index(max_temp)
-            min_idx = temperatures.index(min_temp)
-
             # Annotate maximum
             ax.annotate(f'{max_temp:.0f}{unit}',
                        xy=(hours[max_idx], max_temp),
@@ -103,7 +184,7 @@ class TemperatureGraph:
                        fontsize=9, fontweight='bold')
 
         # Highlight current hour
-        current_hour = datetime.now().hour
+        current_hour = (now or datetime.now()).hour
         if current_hour in hours:
             ax.axvline(x=current_hour, color='red', linestyle=':', linewidth=2, alpha=0.7)
             ax.text(current_hour, ax.get_ylim()[1] * 0.95, 'NOW',
@@ -111,46 +192,32 @@ class TemperatureGraph:
 
         # Set reasonable y-axis limits
         if temperatures:
-            temp_range = max(temperatures) - min(temperatures)
-            ax.set_ylim(min(temperatures) - temp_range * 0.2,
-                       max(temperatures) + temp_range * 0.2)
+            temp_range = max_temp - min_temp
+            ax.set_ylim(min_temp - temp_range * 0.2,
+                       max_temp + temp_range * 0.2)
 
         # Tight layout
-        plt.tight_layout()
-
-        # Convert to PIL Image
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image = Image.open(buffer)
+        fig.tight_layout()
 
-        # Clean up
-        plt.close(fig)
-
-        return image
+        return self._render(fig)
 
     def create_simple_graph(self, hours: List[int], temperatures: List[float],
-                          unit: str = "°F") -> Image.Image:
+                          unit: str = "°F", now: Optional[datetime] = None) -> Image.Image:
         """Create a simplified temperature graph for e-ink display.
 
         Args:
             hours: List of hours (0-23)
             temperatures: List of temperatures for each hour
             unit: Temperature unit string
+            now: Time used to mark the current hour (defaults to the current time)
 
         Returns:
             PIL Image object containing the graph
         """
-        from datetime import datetime
-
-        # Create figure with specified size
-        fig_width = self.width / self.dpi
-        fig_height = self.height / self.dpi
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=self.dpi)
+        fig, ax = self._get_axes('simple')
 
         # Clean white background
         ax.set_facecolor('white')
-        fig.patch.set_facecolor('white')
 
         # Simple black line plot
         ax.plot(hours, temperatures, color='black', linewidth=3)
@@ -169,7 +236,7 @@ class TemperatureGraph:
         ax.set_ylabel(f'Temp ({unit})', fontsize=11)
 
         # Add horizontal line at current hour
-        current_hour = datetime.now().hour
+        current_hour = (now or datetime.now()).hour
         if current_hour in hours:
             temp_at_hour = temperatures[hours.index(current_hour)]
             ax.plot(current_hour, temp_at_hour, 'ro', markersize=8)
@@ -190,15 +257,120 @@ class TemperatureGraph:
         ax.set_axisbelow(True)
 
         # Tight layout
-        plt.tight_layout(pad=0.5)
+        fig.tight_layout(pad=0.5)
+
+        return self._render(fig)
 
-        # Convert to PIL Image
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', facecolor='white', edgecolor='none', dpi=self.dpi)
-        buffer.seek(0)
-        image = Image.open(buffer)
+    def create_simple_graph_fast(self, hours: List[int], temperatures: List[float],
+                                 unit: str = "°F", now: Optional[datetime] = None) -> Image.Image:
+        """Rasterize the simple temperature graph directly into a NumPy buffer.
 
-        # Clean up
-        plt.close(fig)
+        Draws the same elements as create_simple_graph (left/bottom axes, dotted
+        horizontal grid, thick temperature line, current-hour marker and
+        high/low labels) without going through Matplotlib. Only the few text
+        labels use Pillow.
 
-        return image
\ No newline at end of file
+        Args:
+            hours: List of hours (0-23)
+            temperatures: List of temperatures for each hour; missing hours
+                may be None or NaN and are left out of the line
+            unit: Temperature unit string
+            now: Time used to mark the current hour (defaults to the current time)
+
+        Returns:
+            PIL Image object containing the graph, blank if no hour has a
+            temperature
+        """
+        width, height = self.width, self.height
+        left, top, right, bottom = _FAST_MARGINS
+        x0, x1 = left, width - right - 1
+        y0, y1 = top, height - bottom - 1
+
+        # Drop missing hours before they reach the axis range or the line
+        hrs = np.asarray(hours, dtype=float)
+        temps = np.asarray(temperatures, dtype=float)
+        valid = ~(np.isnan(hrs) | np.isnan(temps))
+        hrs, temps = hrs[valid], temps[valid]
+        if not temps.size:
+            return Image.new('RGB', (width, height), (255, 255, 255))
+        min_temp, max_temp = float(temps.min()), float(temps.max())
+
+        # Data limits: the whole day across, temperatures padded by 10%
+        h_lo, h_hi = min(0.0, hrs.min()), max(23.0, hrs.max())
+        pad = max((max_temp - min_temp) * 0.1, 1.0)
+        t_lo, t_hi = min_temp - pad, max_temp + pad
+
+        # Keep the line clear of the axis and the end tick labels inside the image
+        data_x0, data_x1 = x0 + 30, x1 - 30
+
+        def to_x(h):
+            return np.rint(data_x0 + (np.asarray(h) - h_lo) * (data_x1 - data_x0)
+                           / (h_hi - h_lo)).astype(np.intp)
+
+        def to_y(t):
+            return np.rint(y1 - (np.asarray(t) - t_lo) * (y1 - y0) / (t_hi - t_lo)).astype(np.intp)
+
+        img_array = np.full((height, width, 3), 255, dtype=np.uint8)
+
+        # Dotted horizontal grid lines at each temperature tick
+        y_ticks = _nice_ticks(t_lo, t_hi)
+        tick_rows = to_y(y_ticks)
+        img_array[tick_rows[:, None], np.arange(x0, x1, 4)] = _GRID_COLOR
+
+        # Axes with outward tick marks
+        img_array[y0:y1 + 1, x0] = 0
+        img_array[y1, x0:x1 + 1] = 0
+        tick_cols = to_x(_FAST_TICK_HOURS)
+        img_array[np.arange(y1, y1 + 5)[:, None], tick_cols] = 0
+        img_array[tick_rows[:, None], np.arange(x0 - 4, x0)] = 0
+
+        # Temperature line: sample every segment at one point per pixel step,
+        # then stamp a 3x3 pen at each sample
+        xs, ys = to_x(hrs), to_y(temps)
+        if len(xs) > 1:
+            steps = np.maximum(np.abs(np.diff(xs)), np.abs(np.diff(ys))) + 1
+            seg = np.repeat(np.arange(len(steps)), steps)
+            pos = np.arange(steps.sum()) - np.repeat(np.cumsum(steps) - steps, steps)
+            frac = pos / np.repeat(np.maximum(steps - 1, 1), steps)
+            line_x = np.rint(xs[seg] + (xs[seg + 1] - xs[seg]) * frac).astype(np.intp)
+            line_y = np.rint(ys[seg] + (ys[seg + 1] - ys[seg]) * frac).astype(np.intp)
+        else:
+            line_x, line_y = xs, ys
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                img_array[np.clip(line_y + dy, 0, height - 1),
+                          np.clip(line_x + dx, 0, width - 1)] = 0
+
+        # Red dot at the current hour
+        current_hour = (now or datetime.now()).hour
+        current = np.flatnonzero(hrs == current_hour)
+        if current.size:
+            cx = int(to_x(current_hour))
+            cy = int(to_y(temps[current[0]]))
+            radius = 5
+            dot_y, dot_x = np.nonzero(np.add.outer(np.arange(-radius, radius + 1) ** 2,
+                                                   np.arange(-radius, radius + 1) ** 2) <= radius ** 2)
+            img_array[np.clip(cy + dot_y - radius, 0, height - 1),
+                      np.clip(cx + dot_x - radius, 0, width - 1)] = (255, 0, 0)
+
+        # Text labels
+        image = Image.fromarray(img_array)
+        draw = ImageDraw.Draw(image)
+        font = get_font(14)
+        for col, label in zip(tick_cols, _FAST_TICK_LABELS):
+            draw.text((int(col), y1 + 7), label, font=font, fill=(0, 0, 0), anchor='ma')
+        for row, value in zip(tick_rows, y_ticks):
+            draw.text((x0 - 7, int(row)), f'{value:.0f}', font=font, fill=(0, 0, 0), anchor='rm')
+        draw.text((x0 + 8, y0), f'High: {max_temp:.0f}{unit}', font=font, fill=(0, 0, 0))
+        draw.text((x0 + 8, y0 + 20), f'Low: {min_temp:.0f}{unit}', font=font, fill=(0, 0, 0))
+
+        # Vertical axis label, drawn into a mask and rotated
+        label = f'Temp ({unit})'
+        label_font = get_font(15)
+        _, _, label_w, label_h = label_font.getbbox(label)
+        mask = Image.new('L', (label_w, label_h))
+        ImageDraw.Draw(mask).text((0, 0), label, font=label_font, fill=255)
+        mask = mask.rotate(90, expand=True)
+        image.paste((0, 0, 0), (4, (y0 + y1 - mask.height) // 2), mask)
+
+        return image
@@ -5,6 +5,10 @@ from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
+from familydashboard.components.dithering import SpectraE6Dithering
+from familydashboard.components.fonts import load_font
+
+
 class DashboardLayout:
     """Manages the layout for a 1600x1200 e-ink display dashboard."""
 
@@ -26,10 +30,19 @@ class DashboardLayout:
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
 
-        # Create the base image (white background)
+        # Create the base image (white background). self.image is never rebound:
+        # clear() and all drawing write into it in place, so the single
+        # self.draw handle always targets the live canvas.
         self.image = Image.new('RGB', (self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT), self.WHITE)
         self.draw = ImageDraw.Draw(self.image)
 
+        # Palette image used to quantize the canvas on save. Same colors in the
+        # same index order as the dithering pipeline, so both write PNGs whose
+        # indices mean the same panel color.
+        self._palette_image = Image.new('P', (1, 1))
+        self._palette_image.putpalette(
+            [c for color in SpectraE6Dithering.E6_PALETTE.values() for c in color])
+
         # Define layout regions
         self.regions = {
             'header': (0, 0, self.DISPLAY_WIDTH, 150),  # Date and time
@@ -42,6 +55,22 @@ class DashboardLayout:
         # Font settings (will use default for now)
         self.fonts = self._load_fonts()
 
+        # Line height (ascent + descent) for each font, measured once
+        self.line_heights = {name: sum(font.getmetrics()) for name, font in self.fonts.items()}
+
+        # Alignment -> specialized text drawer (unknown values draw left-aligned)
+        self._text_drawers = {
+            'left': self._draw_text_left,
+            'center': self._draw_text_center,
+            'right': self._draw_text_right,
+        }
+
+        # The region borders never change, so draw them once into a template
+        # that every render starts from
+        for region in self.regions:
+            self.draw_border(region, self.GRAY, 1)
+        self._template = self.image.copy()
+
     def _load_fonts(self) -> Dict[str, ImageFont.FreeTypeFont]:
         """Load fonts for different text sizes.
 
@@ -51,11 +80,11 @@ class DashboardLayout:
         # For now, use default font - can be replaced with TTF fonts later
         try:
             return {
-                'title': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 72),
-                'header': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48),
-                'subheader': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36),
-                'body': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 28),
-                'small': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20),
+                'title': load_font("/System/Library/Fonts/Helvetica.ttc", 72),
+                'header': load_font("/System/Library/Fonts/Helvetica.ttc", 48),
+                'subheader': load_font("/System/Library/Fonts/Helvetica.ttc", 36),
+                'body': load_font("/System/Library/Fonts/Helvetica.ttc", 28),
+                'small': load_font("/System/Library/Fonts/Helvetica.ttc", 20),
             }
         except:
             # Fallback to default font
@@ -79,8 +108,12 @@ class DashboardLayout:
         if region_name not in self.regions:
             return
 
+        # Four solid strips filled directly, same pixels as an outlined rectangle
         x1, y1, x2, y2 = self.regions[region_name]
-        self.draw.rectangle([x1, y1, x2-1, y2-1], outline=color, width=width)
+        self.image.paste(color, (x1, y1, x2, y1 + width))
+        self.image.paste(color, (x1, y2 - width, x2, y2))
+        self.image.paste(color, (x1, y1, x1 + width, y2))
+        self.image.paste(color, (x2 - width, y1, x2, y2))
 
     def draw_text_in_region(self, region_name: str, text: str, font_size: str = 'body',
                            color: Tuple[int, int, int] = BLACK,
@@ -98,24 +131,53 @@ class DashboardLayout:
         if region_name not in self.regions:
             return
 
-        x1, y1, x2, y2 = self.regions[region_name]
         font = self.fonts.get(font_size, self.fonts['body'])
+        draw = self._text_drawers.get(align, self._draw_text_left)
+        draw(region_name, text, font, color, padding)
+
+    def _draw_text_left(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                        color: Tuple[int, int, int], padding: int):
+        """Draw left-aligned text in a region; needs no width measurement.
+
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top and left borders
+        """
+        x1, y1, _, _ = self.regions[region_name]
+        self.draw.text((x1 + padding, y1 + padding), text, font=font, fill=color)
 
-        # Calculate text position based on alignment
-        text_bbox = self.draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
+    def _draw_text_center(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                          color: Tuple[int, int, int], padding: int):
+        """Draw horizontally centered text in a region.
 
-        if align == 'center':
-            x = x1 + (x2 - x1 - text_width) // 2
-        elif align == 'right':
-            x = x2 - text_width - padding
-        else:  # left
-            x = x1 + padding
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top border
+        """
+        x1, y1, x2, _ = self.regions[region_name]
+        x = x1 + (x2 - x1 - int(font.getlength(text))) // 2
+        self.draw.text((x, y1 + padding), text, font=font, fill=color)
 
-        y = y1 + padding
+    def _draw_text_right(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                         color: Tuple[int, int, int], padding: int):
+        """Draw right-aligned text in a region.
 
-        self.draw.text((x, y), text, font=font, fill=color)
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top and right borders
+        """
+        _, y1, x2, _ = self.regions[region_name]
+        x = x2 - int(font.getlength(text)) - padding
+        self.draw.text((x, y1 + padding), text, font=font, fill=color)
 
     def draw_multiline_text(self, region_name: str, lines: list, font_size: str = 'body',
                            color: Tuple[int, int, int] = BLACK, line_spacing: int = 10,
@@ -136,39 +198,47 @@ class DashboardLayout:
         x1, y1, x2, y2 = self.regions[region_name]
         font = self.fonts.get(font_size, self.fonts['body'])
 
-        y = y1 + padding
-        for line in lines:
-            if y >= y2 - padding:
-                break
+        line_pitch = self.line_heights.get(font_size, self.line_heights['body']) + line_spacing
 
-            self.draw.text((x1 + padding, y), line, font=font, fill=color)
+        # Keep the lines whose top edge starts inside the padded region
+        available = y2 - y1 - 2 * padding
+        max_lines = max(0, -(-available // line_pitch))
+        lines = lines[:max_lines]
+        if not lines:
+            return
 
-            # Calculate line height
-            bbox = self.draw.textbbox((0, 0), line or "M", font=font)
-            line_height = bbox[3] - bbox[1]
-            y += line_height + line_spacing
+        # Draw the block in one call. Pillow steps lines by the bottom of "A"
+        # plus spacing, so convert our pitch into its spacing argument.
+        spacing = line_pitch - font.getbbox("A")[3]
+        self.draw.multiline_text((x1 + padding, y1 + padding), "\n".join(lines),
+                                 font=font, fill=color, spacing=spacing)
 
-    def save(self, filename: Optional[str] = None) -> Path:
+    def save(self, filename: Optional[str] = None, now: Optional[datetime] = None) -> Path:
         """Save the dashboard image.
 
         Args:
             filename: Output filename (defaults to timestamp)
+            now: Time used for the default filename (defaults to the current time)
 
         Returns:
             Path to saved image
         """
         if filename is None:
-            filename = f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            filename = f"dashboard_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}.png"
 
         output_path = self.output_dir / filename
-        self.image.save(output_path, 'PNG')
+        # The panel only has six colors, so store 4-bit palette indices rather
+        # than 24-bit RGB. Fast deflate: the PNG is a hand-off to the display.
+        indexed = self.image.quantize(palette=self._palette_image,
+                                      dither=Image.Dither.FLOYDSTEINBERG)
+        indexed.save(output_path, 'PNG', bits=4, compress_level=1, optimize=False)
         return output_path
 
     def clear(self):
-        """Clear the dashboard to white background."""
-        self.draw.rectangle([0, 0, self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT], fill=self.WHITE)
+        """Reset the dashboard to the static layout (white background and region borders)."""
+        self.image.paste(self._template, (0, 0))
 
-    def render_dashboard(self, data: Dict[str, Any]) -> Path:
+    def render_dashboard(self, data: Dict[str, Any], now: Optional[datetime] = None) -> Path:
         """Render the complete dashboard with provided data.
 
         Args:
@@ -177,19 +247,20 @@ class DashboardLayout:
                 - weather: Weather information dict
                 - schedule: List of schedule items
                 - lunch: Lunch menu (if school day)
+            now: Render timestamp (defaults to the current time)
 
         Returns:
             Path to saved image
         """
-        self.clear()
+        if now is None:
+            now = datetime.now()
 
-        # Draw borders for visual structure
-        for region in self.regions:
-            self.draw_border(region, self.GRAY, 1)
+        # Start from the template, which already has the region borders
+        self.clear()
 
         # Render date header
         if 'date' in data:
-            self.draw_text_in_region('header', data['date'], 'title', self.BLACK)
+            self._draw_text_center('header', data['date'], self.fonts['title'], self.BLACK, 20)
 
         # Render weather
         if 'weather' in data:
@@ -212,7 +283,7 @@ class DashboardLayout:
             self.draw_multiline_text('schedule', schedule_lines, 'body')
 
         # Footer with update time
-        update_time = f"Updated: {datetime.now().strftime('%H:%M')}"
-        self.draw_text_in_region('footer', update_time, 'small', self.GRAY, align='right')
+        update_time = f"Updated: {now.strftime('%H:%M')}"
+        self._draw_text_right('footer', update_time, self.fonts['small'], self.GRAY, 20)
 
-        return self.save()
\ No newline at end of file
+        return self.save(now=now)
\ No newline at end of file
@@ -4,15 +4,78 @@ from PIL import Image, ImageDraw, ImageFont
 from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+from familydashboard.components.fonts import load_font
 from familydashboard.components.weather_graph import TemperatureGraph
 from familydashboard.components.dithering import OptimizedE6Dithering
 from familydashboard.components.test_image import create_test_pattern, create_photo_like_image
+from familydashboard.providers.weather import Forecast
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_fonts() -> Dict[str, ImageFont.FreeTypeFont]:
+    """Load fonts for different text sizes, once per process.
+
+    Returns:
+        Dictionary of font objects by size name
+    """
+    fonts = {}
+
+    # Try to load Font Awesome 7 Duotone for icons
+    try:
+        fonts['icon'] = load_font("fonts/Font Awesome 7 Duotone-Solid-900.otf", 100)
+        fonts['icon_small'] = load_font("fonts/Font Awesome 7 Duotone-Solid-900.otf", 48)
+        fonts['icon_medium'] = load_font("fonts/Font Awesome 7 Duotone-Solid-900.otf", 72)
+    except Exception as e:
+        logger.warning(f"Font Awesome 7 Duotone not found: {e}, icons will not display")
+        fonts['icon'] = ImageFont.load_default()
+        fonts['icon_small'] = ImageFont.load_default()
+        fonts['icon_medium'] = ImageFont.load_default()
+
+    # Load regular fonts
+    try:
+        fonts.update({
+            'title': load_font("/System/Library/Fonts/Helvetica.ttc", 56),
+            'header': load_font("/System/Library/Fonts/Helvetica.ttc", 42),
+            'subheader': load_font("/System/Library/Fonts/Helvetica.ttc", 32),
+            'body': load_font("/System/Library/Fonts/Helvetica.ttc", 26),
+            'small': load_font("/System/Library/Fonts/Helvetica.ttc", 20),
+            'tiny': load_font("/System/Library/Fonts/Helvetica.ttc", 16),
+        })
+    except:
+        # Fallback to default font
+        default = ImageFont.load_default()
+        fonts.update({
+            'title': default,
+            'header': default,
+            'subheader': default,
+            'body': default,
+            'small': default,
+            'tiny': default,
+        })
+
+    return fonts
+
+
+@lru_cache(maxsize=None)
+def _get_temp_graph(width: int, height: int, dpi: int) -> TemperatureGraph:
+    """Get the shared temperature graph renderer for a given size.
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+        dpi: DPI for the graph
+
+    Returns:
+        TemperatureGraph instance reused by every layout
+    """
+    return TemperatureGraph(width=width, height=height, dpi=dpi)
+
+
 class EnhancedDashboardLayout:
     """Enhanced dashboard layout with weather graphics for a 1600x1200 e-ink display."""
 
@@ -34,7 +97,9 @@ class EnhancedDashboardLayout:
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
 
-        # Create the base image (white background)
+        # Create the base image (white background). Keep this object for the
+        # lifetime of the layout - clear() pastes into it rather than replacing
+        # it, which keeps self.draw valid without re-creating it.
         self.image = Image.new('RGB', (self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT), self.WHITE)
         self.draw = ImageDraw.Draw(self.image)
 
@@ -52,53 +117,59 @@ class EnhancedDashboardLayout:
         }
 
         # Font settings
-        self.fonts = self._load_fonts()
+        # Copy so per-instance tweaks don't leak into the shared font table
+        self.fonts = dict(_load_fonts())
+
+        # Line height (ascent + descent) for each font, measured once
+        self.line_heights = {name: sum(font.getmetrics()) for name, font in self.fonts.items()}
+
+        # Alignment -> specialized text drawer (unknown values draw left-aligned)
+        self._text_drawers = {
+            'left': self._draw_text_left,
+            'center': self._draw_text_center,
+            'right': self._draw_text_right,
+        }
+
+        # Rasterized weather icons: glyph -> (alpha mask, bbox left, bbox top)
+        self._icon_cache: Dict[str, Tuple[Image.Image, int, int]] = {}
+
+        # Static scaffold every render starts from; rebuild it if fonts or
+        # regions change
+        self._template = self._build_background_template()
 
         # Temperature graph generator
-        self.temp_graph = TemperatureGraph(width=1060, height=250, dpi=100)
+        self.temp_graph = _get_temp_graph(1060, 250, 100)
 
-    def _load_fonts(self) -> Dict[str, ImageFont.FreeTypeFont]:
-        """Load fonts for different text sizes.
+        # E6 ditherer; its palette lookup table is built once here, not per render
+        self._ditherer = OptimizedE6Dithering(preserve_text=True)
+
+    def _build_background_template(self) -> Image.Image:
+        """Draw the parts of the dashboard that never change and snapshot them.
+
+        This covers the region borders (the graph region is left unbordered)
+        and the dithering test pattern with its label.
 
         Returns:
-            Dictionary of font objects by size name
+            Copy of the canvas with the static scaffold drawn
         """
-        fonts = {}
+        for region in self.regions:
+            if region != 'weather_graph':
+                self.draw_border(region, self.GRAY, 1)
 
-        # Try to load Font Awesome 7 Duotone for icons
+        # Add test image for dithering demonstration
         try:
-            fonts['icon'] = ImageFont.truetype("fonts/Font Awesome 7 Duotone-Solid-900.otf", 100)
-            fonts['icon_small'] = ImageFont.truetype("fonts/Font Awesome 7 Duotone-Solid-900.otf", 48)
-            fonts['icon_medium'] = ImageFont.truetype("fonts/Font Awesome 7 Duotone-Solid-900.otf", 72)
+            # Create a colorful test pattern directly at the region size
+            x1, y1, x2, y2 = self.regions['test_image']
+            test_img = create_test_pattern(x2 - x1, y2 - y1)
+            self.image.paste(test_img, (x1, y1))
+
+            # Add label
+            self.draw.text((x1 + 10, y1 + 10), "Color Test Pattern",
+                          font=self.fonts.get('small', self.fonts['body']), fill=self.WHITE)
         except Exception as e:
-            logger.warning(f"Font Awesome 7 Duotone not found: {e}, icons will not display")
-            fonts['icon'] = ImageFont.load_default()
-            fonts['icon_small'] = ImageFont.load_default()
-            fonts['icon_medium'] = ImageFont.load_default()
+            logger.warning(f"Could not add test image: {e}")
 
-        # Load regular fonts
-        try:
-            fonts.update({
-                'title': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 56),
-                'header': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 42),
-                'subheader': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32),
-                'body': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 26),
-                'small': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20),
-                'tiny': ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16),
-            })
-        except:
-            # Fallback to default font
-            default = ImageFont.load_default()
-            fonts.update({
-                'title': default,
-                'header': default,
-                'subheader': default,
-                'body': default,
-                'small': default,
-                'tiny': default,
-            })
-
-        return fonts
+        return self.image.copy()
 
     def draw_border(self, region_name: str, color: Tuple[int, int, int] = GRAY, width: int = 1):
         """Draw a border around a region.
@@ -111,8 +182,12 @@ class EnhancedDashboardLayout:
         if region_name not in self.regions:
             return
 
+        # Four solid strips filled directly, same pixels as an outlined rectangle
         x1, y1, x2, y2 = self.regions[region_name]
-        self.draw.rectangle([x1, y1, x2-1, y2-1], outline=color, width=width)
+        self.image.paste(color, (x1, y1, x2, y1 + width))
+        self.image.paste(color, (x1, y2 - width, x2, y2))
+        self.image.paste(color, (x1, y1, x1 + width, y2))
+        self.image.paste(color, (x2 - width, y1, x2, y2))
 
     def draw_text_in_region(self, region_name: str, text: str, font_size: str = 'body',
                            color: Tuple[int, int, int] = BLACK,
@@ -130,23 +205,53 @@ class EnhancedDashboardLayout:
         if region_name not in self.regions:
             return
 
-        x1, y1, x2, y2 = self.regions[region_name]
         font = self.fonts.get(font_size, self.fonts['body'])
+        draw = self._text_drawers.get(align, self._draw_text_left)
+        draw(region_name, text, font, color, padding)
 
-        # Calculate text position based on alignment
-        text_bbox = self.draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
+    def _draw_text_left(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                        color: Tuple[int, int, int], padding: int):
+        """Draw left-aligned text in a region; needs no width measurement.
 
-        if align == 'center':
-            x = x1 + (x2 - x1 - text_width) // 2
-        elif align == 'right':
-            x = x2 - text_width - padding
-        else:  # left
-            x = x1 + padding
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top and left borders
+        """
+        x1, y1, _, _ = self.regions[region_name]
+        self.draw.text((x1 + padding, y1 + padding), text, font=font, fill=color)
 
-        y = y1 + padding
+    def _draw_text_center(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                          color: Tuple[int, int, int], padding: int):
+        """Draw horizontally centered text in a region.
 
-        self.draw.text((x, y), text, font=font, fill=color)
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top border
+        """
+        x1, y1, x2, _ = self.regions[region_name]
+        x = x1 + (x2 - x1 - int(font.getlength(text))) // 2
+        self.draw.text((x, y1 + padding), text, font=font, fill=color)
+
+    def _draw_text_right(self, region_name: str, text: str, font: ImageFont.FreeTypeFont,
+                         color: Tuple[int, int, int], padding: int):
+        """Draw right-aligned text in a region.
+
+        Args:
+            region_name: Name of the region to draw in
+            text: Text to draw
+            font: Font to draw with
+            color: Text color
+            padding: Padding from the region's top and right borders
+        """
+        _, y1, x2, _ = self.regions[region_name]
+        x = x2 - int(font.getlength(text)) - padding
+        self.draw.text((x, y1 + padding), text, font=font, fill=color)
 
     def draw_multiline_text(self, region_name: str, lines: list, font_size: str = 'body',
                            color: Tuple[int, int, int] = BLACK, line_spacing: int = 8,
@@ -167,17 +272,20 @@ class EnhancedDashboardLayout:
         x1, y1, x2, y2 = self.regions[region_name]
         font = self.fonts.get(font_size, self.fonts['body'])
 
-        y = y1 + padding
-        for line in lines:
-            if y >= y2 - padding:
-                break
+        line_pitch = self.line_heights.get(font_size, self.line_heights['body']) + line_spacing
 
-            self.draw.text((x1 + padding, y), line, font=font, fill=color)
+        # Keep the lines whose top edge starts inside the padded region
+        available = y2 - y1 - 2 * padding
+        max_lines = max(0, -(-available // line_pitch))
+        lines = lines[:max_lines]
+        if not lines:
+            return
 
-            # Calculate line height
-            bbox = self.draw.textbbox((0, 0), line or "M", font=font)
-            line_height = bbox[3] - bbox[1]
-            y += line_height + line_spacing
+        # Draw the block in one call. Pillow steps lines by the bottom of "A"
+        # plus spacing, so convert our pitch into its spacing argument.
+        spacing = line_pitch - font.getbbox("A")[3]
+        self.draw.multiline_text((x1 + padding, y1 + padding), "\n".join(lines),
+                                 font=font, fill=color, spacing=spacing)
 
     def draw_weather_icon(self, icon_unicode: str, color: Tuple[int, int, int] = BLACK):
         """Draw a weather icon in the weather_icon region.
@@ -190,17 +298,25 @@ class EnhancedDashboardLayout:
             return
 
         x1, y1, x2, y2 = self.regions['weather_icon']
-        font = self.fonts.get('icon', self.fonts['body'])
-
-        # Center the icon in the region
-        text_bbox = self.draw.textbbox((0, 0), icon_unicode, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
 
+        # Only a handful of icons ever appear, so render each glyph through
+        # FreeType once and composite the cached mask afterwards
+        cached = self._icon_cache.get(icon_unicode)
+        if cached is None:
+            font = self.fonts.get('icon', self.fonts['body'])
+            left, top, right, bottom = font.getbbox(icon_unicode)
+            mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+            ImageDraw.Draw(mask).text((-left, -top), icon_unicode, font=font, fill=255)
+            cached = self._icon_cache[icon_unicode] = (mask, left, top)
+        mask, left, top = cached
+        text_width, text_height = mask.size
+
+        # Center the icon in the region (same placement as drawing the text
+        # at (x, y), whose ink starts at the bbox offset)
         x = x1 + (x2 - x1 - text_width) // 2
         y = y1 + (y2 - y1 - text_height) // 2
 
-        self.draw.text((x, y), icon_unicode, font=font, fill=color)
+        self.image.paste(color, (x + left, y + top), mask)
 
     def paste_graph(self, graph_image: Image.Image, region_name: str = 'weather_graph'):
         """Paste a graph image into a region.
@@ -219,93 +335,95 @@ class EnhancedDashboardLayout:
         region_height = y2 - y1
 
         if graph_image.width != region_width or graph_image.height != region_height:
-            graph_image = graph_image.resize((region_width, region_height), Image.Resampling.LANCZOS)
+            # The panel is dithered to six colours, so a cheap filter is enough;
+            # BOX is an exact average when shrinking by whole factors
+            if graph_image.width % region_width == 0 and graph_image.height % region_height == 0:
+                resample = Image.Resampling.BOX
+            else:
+                resample = Image.Resampling.BILINEAR
+            graph_image = graph_image.resize((region_width, region_height), resample)
 
         # Paste the graph
         self.image.paste(graph_image, (x1, y1))
 
     def clear(self):
-        """Clear the dashboard to white background."""
-        self.draw.rectangle([0, 0, self.DISPLAY_WIDTH, self.DISPLAY_HEIGHT], fill=self.WHITE)
+        """Reset the dashboard to the static scaffold (background, borders, test pattern)."""
+        self.image.paste(self._template, (0, 0))
 
-    def save(self, filename: Optional[str] = None) -> Path:
+    def save(self, filename: Optional[str] = None, now: Optional[datetime] = None) -> Path:
         """Save the dashboard image.
 
         Args:
             filename: Output filename (defaults to timestamp)
+            now: Time used for the default filename (defaults to the current time)
 
         Returns:
             Path to saved image
         """
         if filename is None:
-            filename = f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            filename = f"dashboard_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}.png"
 
         output_path = self.output_dir / filename
-        self.image.save(output_path, 'PNG')
+        # Fast deflate: the PNG is a hand-off to the display, size barely matters
+        self.image.save(output_path, 'PNG', compress_level=1, optimize=False)
         return output_path
 
-    def render_enhanced_dashboard(self, data: Dict[str, Any], create_dithered: bool = True) -> Tuple[Path, Optional[Path], Optional[Path]]:
+    def render_enhanced_dashboard(self, data: Dict[str, Any], create_dithered: bool = True,
+                                  now: Optional[datetime] = None,
+                                  save_original: bool = True) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
         """Render the enhanced dashboard with weather graph and icons.
 
         Args:
             data: Dictionary containing dashboard data including weather forecast
             create_dithered: Whether to create dithered version for e-ink
+            now: Render timestamp (defaults to the current time)
+            save_original: Whether to write the undithered RGB image. Only
+                honored when create_dithered is set, since otherwise it is the
+                only output.
 
         Returns:
-            Tuple of (original image path, dithered image path, preview path)
+            Tuple of (original image path, dithered image path, preview path);
+            the original path is None when it was not saved
         """
-        self.clear()
+        if now is None:
+            now = datetime.now()
 
-        # Draw subtle borders for structure
-        for region in self.regions:
-            if region != 'weather_graph':  # Don't border the graph
-                self.draw_border(region, self.GRAY, 1)
+        # Start from the template: borders and the test pattern are already drawn
+        self.clear()
 
         # Render date header
         if 'date' in data:
-            self.draw_text_in_region('header', data['date'], 'title', self.BLACK)
+            self._draw_text_center('header', data['date'], self.fonts['title'], self.BLACK, 20)
 
         # Render weather with enhanced features
         if 'weather_forecast' in data and data['weather_forecast']:
             forecast = data['weather_forecast']
+            if isinstance(forecast, dict):
+                forecast = Forecast.from_dict(forecast)
 
             # Draw weather icon
-            if 'icon' in forecast:
-                self.draw_weather_icon(forecast['icon'], self.BLACK)
+            if forecast.icon:
+                self.draw_weather_icon(forecast.icon, self.BLACK)
 
-            # Weather info text
+            # Weather info text, formatted once when the forecast was built
             weather_lines = [
-                f"{forecast.get('description', 'Unknown')}",
-                f"High: {forecast.get('temperature_high', 'N/A'):.0f}{forecast.get('unit', '')}",
-                f"Low: {forecast.get('temperature_low', 'N/A'):.0f}{forecast.get('unit', '')}",
-                f"Rain: {forecast.get('precipitation_probability', 0)}%"
+                forecast.description_str,
+                forecast.high_str,
+                forecast.low_str,
+                forecast.rain_str,
             ]
             self.draw_multiline_text('weather_info', weather_lines, 'body')
 
             # Create and paste temperature graph
-            if 'hourly_temperatures' in forecast and 'hourly_times' in forecast:
-                graph = self.temp_graph.create_simple_graph(
-                    forecast['hourly_times'],
-                    forecast['hourly_temperatures'],
-                    forecast.get('unit', '°F')
+            if forecast.hourly_temperatures and forecast.hourly_times:
+                graph = self.temp_graph.create_simple_graph_fast(
+                    forecast.hourly_times,
+                    forecast.hourly_temperatures,
+                    forecast.unit,
+                    now=now
                 )
                 self.paste_graph(graph)
 
-        # Add test image for dithering demonstration
-        try:
-            # Create a colorful test pattern
-            test_img = create_test_pattern(400, 300)
-            # Resize to fit the region
-            x1, y1, x2, y2 = self.regions['test_image']
-            test_img = test_img.resize((x2 - x1, y2 - y1), Image.Resampling.LANCZOS)
-            self.image.paste(test_img, (x1, y1))
-
-            # Add label
-            self.draw.text((x1 + 10, y1 + 10), "Color Test Pattern",
-                          font=self.fonts.get('small', self.fonts['body']), fill=self.WHITE)
-        except Exception as e:
-            logger.warning(f"Could not add test image: {e}")
-
         # Render lunch menu (if school day)
         if 'lunch' in data and data['lunch']:
             lunch_lines = ["School Lunch:"] + data['lunch'][:8]  # Limit lines to fit smaller space
@@ -337,22 +455,24 @@ class EnhancedDashboardLayout:
             self.draw_multiline_text('schedule', schedule_lines, 'body')
 
         # Footer with update time
-        update_time = f"Updated: {datetime.now().strftime('%A %H:%M')} | Next update: Tomorrow 6:00 AM"
-        self.draw_text_in_region('footer', update_time, 'small', self.GRAY, align='center')
+        update_time = f"Updated: {now.strftime('%A %H:%M')} | Next update: Tomorrow 6:00 AM"
+        self._draw_text_center('footer', update_time, self.fonts['small'], self.GRAY, 20)
 
-        # Save original image
-        original_path = self.save()
+        # Save original image, unless the dithered output is all that's wanted
+        original_path = None
+        if save_original or not create_dithered:
+            original_path = self.save(now=now)
 
         # Create dithered version if requested
         dithered_path = None
         preview_path = None
         if create_dithered:
             try:
-                ditherer = OptimizedE6Dithering(preserve_text=True)
                 # Preprocess the image for better E6 color mapping
-                preprocessed = ditherer.preprocess_for_e6(self.image)
+                # (process_dashboard does not preprocess again)
+                preprocessed = self._ditherer.preprocess_for_e6(self.image)
                 # Apply dithering
-                dithered_path, preview_path = ditherer.process_dashboard(preprocessed, str(self.output_dir))
+                dithered_path, preview_path = self._ditherer.process_dashboard(preprocessed, str(self.output_dir))
                 logger.info(f"Created dithered version: {dithered_path}")
             except Exception as e:
                 logger.error(f"Failed to create dithered version: {e}")
@@ -1,12 +1,7 @@
 """Main script to generate the family dashboard image."""
 
-import sys
-from pathlib import Path
 from datetime import datetime
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from familydashboard.dashboard import DashboardLayout
 from familydashboard.providers.data_providers import DashboardDataProvider
 
@@ -21,11 +16,12 @@ def generate_dashboard(output_filename: str = None):
     data_provider = DashboardDataProvider()
     dashboard = DashboardLayout()
 
-    # Get current data
-    data = data_provider.get_dashboard_data()
+    # Get current data, with one timestamp shared by data and render
+    now = datetime.now()
+    data = data_provider.get_dashboard_data(now)
 
     # Render and save the dashboard
-    output_path = dashboard.render_dashboard(data)
+    output_path = dashboard.render_dashboard(data, now=now)
 
     print(f"Dashboard generated successfully!")
     print(f"Output: {output_path}")
@@ -1,25 +1,24 @@
 """Enhanced main script with real weather data and temperature graphs."""
 
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 import logging
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from familydashboard.dashboard_enhanced import EnhancedDashboardLayout
 from familydashboard.providers.data_providers import (
     DateProvider,
     ScheduleProvider,
     LunchMenuProvider
 )
-from familydashboard.providers.weather import OpenMeteoWeatherProvider
+from familydashboard.providers.weather import Forecast, OpenMeteoWeatherProvider
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for I/O (the weather request) that overlaps local setup
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard-io")
+
 
 def generate_enhanced_dashboard(
     latitude: float = None,
@@ -68,46 +67,70 @@ def generate_enhanced_dashboard(
         temperature_unit="fahrenheit"
     )
 
+    # Start the weather request first and build everything local while it
+    # is in flight
+    print(f"Fetching weather data for {location_name}...")
+    weather_future = _executor.submit(weather_provider.get_daily_forecast)
+    # The worker closes the session once the request is done, so giving up
+    # on the wait below never closes it while the request is still using it
+    weather_future.add_done_callback(lambda _: weather_provider.close())
+
     # Initialize dashboard
     dashboard = EnhancedDashboardLayout()
 
-    # Get data
-    print(f"Fetching weather data for {location_name}...")
-    weather_forecast = weather_provider.get_daily_forecast()
+    # Snapshot the time once so every section agrees on the day
+    now = datetime.now()
+    weekday = now.weekday()
+    is_school_day = date_provider.is_school_day(now)
+
+    # Prepare the local sections
+    date_str = date_provider.get_current_date(now)
+    schedule = schedule_provider.get_daily_schedule(weekday)
+    lunch = lunch_provider.get_lunch_menu(weekday)
+
+    try:
+        # The budget covers the provider's connect/read timeouts and retries
+        weather_forecast = weather_future.result(timeout=weather_provider.REQUEST_BUDGET)
+    except FutureTimeoutError:
+        logger.warning("Weather request timed out")
+        weather_forecast = None
+    except Exception as e:
+        logger.error(f"Weather request failed: {e}")
+        weather_forecast = None
 
     if weather_forecast:
-        print(f"✓ Weather: {weather_forecast['description']}")
-        print(f"  High: {weather_forecast['temperature_high']:.0f}°F")
-        print(f"  Low: {weather_forecast['temperature_low']:.0f}°F")
-        print(f"  Precipitation: {weather_forecast['precipitation_probability']}%")
+        print(f"✓ Weather: {weather_forecast.description}")
+        print(f"  High: {weather_forecast.temperature_high:.0f}°F")
+        print(f"  Low: {weather_forecast.temperature_low:.0f}°F")
+        print(f"  Precipitation: {weather_forecast.precipitation_probability}%")
     else:
         print("✗ Weather data unavailable (using mock data)")
         # Fallback to mock data
-        weather_forecast = {
-            'description': 'Partly Cloudy',
-            'icon': '\uf0c2',
-            'temperature_high': 75,
-            'temperature_low': 60,
-            'precipitation_probability': 20,
-            'hourly_temperatures': [60, 58, 57, 56, 56, 57, 59, 62, 65, 68, 71, 73,
-                                   75, 75, 74, 73, 71, 69, 67, 65, 63, 62, 61, 60],
-            'hourly_times': list(range(24)),
-            'unit': '°F'
-        }
+        weather_forecast = Forecast(
+            description='Partly Cloudy',
+            icon='\uf0c2',
+            temperature_high=75,
+            temperature_low=60,
+            precipitation_probability=20,
+            hourly_temperatures=(60, 58, 57, 56, 56, 57, 59, 62, 65, 68, 71, 73,
+                                 75, 75, 74, 73, 71, 69, 67, 65, 63, 62, 61, 60),
+            hourly_times=tuple(range(24)),
+            unit='°F'
+        )
 
     # Prepare dashboard data
     data = {
-        'date': date_provider.get_current_date(),
+        'date': date_str,
         'weather_forecast': weather_forecast,
-        'schedule': schedule_provider.get_daily_schedule(),
-        'lunch': lunch_provider.get_lunch_menu(),
-        'is_school_day': date_provider.is_school_day(),
+        'schedule': schedule,
+        'lunch': lunch,
+        'is_school_day': is_school_day,
         'announcements': [
             "Library books due Friday",
             "Soccer practice 5pm Tuesday",
             "Piano recital next Saturday",
             "Parent-teacher conferences next week"
-        ] if date_provider.is_school_day() else [
+        ] if is_school_day else [
             "Family movie night 7pm",
             "Park visit if weather permits",
             "Meal prep for the week",
@@ -117,10 +140,12 @@ def generate_enhanced_dashboard(
 
     # Render and save the dashboard
     print("Generating dashboard image...")
-    original_path, dithered_path, preview_path = dashboard.render_enhanced_dashboard(data, create_dithered=True)
+    original_path, dithered_path, preview_path = dashboard.render_enhanced_dashboard(
+        data, create_dithered=True, now=now)
 
     print(f"\n✓ Dashboard generated successfully!")
-    print(f"  Original: {original_path}")
+    if original_path:
+        print(f"  Original: {original_path}")
     if dithered_path:
         print(f"  E6 Dithered: {dithered_path}")
         print(f"  Preview: {preview_path}")
@@ -1,30 +1,159 @@
 """Mock data providers for dashboard content."""
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import random
 
+# Mock schedules, indexed by weekday (Monday = 0)
+_DAILY_SCHEDULES: Tuple[Tuple[str, ...], ...] = (
+    (  # Monday
+        "7:00 AM - Wake up / Breakfast",
+        "8:00 AM - School drop-off",
+        "9:00 AM - Work from home",
+        "12:00 PM - Lunch",
+        "3:30 PM - School pickup",
+        "5:00 PM - Soccer practice (Sam)",
+        "6:30 PM - Dinner",
+        "8:00 PM - Bedtime routine",
+    ),
+    (  # Tuesday
+        "7:00 AM - Wake up / Breakfast",
+        "8:00 AM - School drop-off",
+        "9:00 AM - Work from home",
+        "12:00 PM - Lunch",
+        "3:30 PM - School pickup",
+        "4:00 PM - Piano lessons (Emma)",
+        "6:00 PM - Dinner",
+        "7:30 PM - Family game night",
+        "8:30 PM - Bedtime routine",
+    ),
+    (  # Wednesday
+        "7:00 AM - Wake up / Breakfast",
+        "8:00 AM - School drop-off",
+        "9:00 AM - Office day",
+        "12:30 PM - Team lunch",
+        "3:30 PM - School pickup (Grandma)",
+        "6:30 PM - Dinner",
+        "8:00 PM - Bedtime routine",
+    ),
+    (  # Thursday
+        "7:00 AM - Wake up / Breakfast",
+        "8:00 AM - School drop-off",
+        "9:00 AM - Work from home",
+        "11:00 AM - Parent-teacher conference",
+        "12:00 PM - Lunch",
+        "3:30 PM - School pickup",
+        "4:30 PM - Library trip",
+        "6:00 PM - Dinner",
+        "8:00 PM - Bedtime routine",
+    ),
+    (  # Friday
+        "7:00 AM - Wake up / Breakfast",
+        "8:00 AM - School drop-off",
+        "9:00 AM - Work from home",
+        "12:00 PM - Lunch",
+        "3:30 PM - School pickup",
+        "5:00 PM - Movie night prep",
+        "6:00 PM - Pizza dinner",
+        "7:00 PM - Family movie night",
+        "9:00 PM - Bedtime routine",
+    ),
+    (  # Saturday
+        "8:00 AM - Weekend breakfast",
+        "9:30 AM - Soccer game (Sam)",
+        "11:00 AM - Farmers market",
+        "12:30 PM - Lunch",
+        "2:00 PM - Park / Playground",
+        "4:00 PM - Free time",
+        "6:00 PM - Dinner",
+        "8:00 PM - Bedtime routine",
+    ),
+    (  # Sunday
+        "8:30 AM - Weekend breakfast",
+        "10:00 AM - Family walk",
+        "11:30 AM - Meal prep",
+        "12:30 PM - Lunch",
+        "2:00 PM - Quiet time / Naps",
+        "3:30 PM - Board games",
+        "5:00 PM - Early dinner",
+        "6:00 PM - Bath time",
+        "7:30 PM - Story time",
+        "8:00 PM - Bedtime",
+    ),
+)
+
+# Mock school lunch menus, indexed by weekday (Monday = 0); None on weekends
+_LUNCH_MENUS: Tuple[Optional[Tuple[str, ...]], ...] = (
+    (  # Monday
+        "Main: Chicken Nuggets",
+        "Side: Tater Tots",
+        "Vegetable: Carrots & Ranch",
+        "Fruit: Apple Slices",
+        "Drink: Milk or Juice",
+    ),
+    (  # Tuesday
+        "Main: Cheese Pizza",
+        "Side: Garden Salad",
+        "Vegetable: Cucumber Slices",
+        "Fruit: Orange Wedges",
+        "Drink: Milk or Juice",
+    ),
+    (  # Wednesday
+        "Main: Spaghetti & Meatballs",
+        "Side: Garlic Bread",
+        "Vegetable: Green Beans",
+        "Fruit: Fruit Cup",
+        "Drink: Milk or Juice",
+    ),
+    (  # Thursday
+        "Main: Turkey & Cheese Sandwich",
+        "Side: Pretzels",
+        "Vegetable: Baby Carrots",
+        "Fruit: Banana",
+        "Drink: Milk or Juice",
+    ),
+    (  # Friday
+        "Main: Fish Sticks",
+        "Side: Mac & Cheese",
+        "Vegetable: Corn",
+        "Fruit: Strawberries",
+        "Drink: Milk or Juice",
+    ),
+    None,  # Saturday
+    None,  # Sunday
+)
+
+
 class DateProvider:
     """Provides formatted date and time information."""
 
     @staticmethod
-    def get_current_date() -> str:
+    def get_current_date(now: Optional[datetime] = None) -> str:
         """Get formatted current date.
 
+        Args:
+            now: Date to format (defaults to the current time)
+
         Returns:
             Formatted date string
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         return now.strftime("%A, %B %d, %Y")
 
     @staticmethod
-    def is_school_day() -> bool:
+    def is_school_day(now: Optional[datetime] = None) -> bool:
         """Check if today is a school day.
 
+        Args:
+            now: Date to check (defaults to the current time)
+
         Returns:
             True if it's a weekday (Mon-Fri)
         """
-        return datetime.now().weekday() < 5  # Monday = 0, Sunday = 6
+        if now is None:
+            now = datetime.now()
+        return now.weekday() < 5  # Monday = 0, Sunday = 6
 
 
 class WeatherProvider:
@@ -57,152 +186,37 @@ class ScheduleProvider:
     """Provides daily schedule information."""
 
     @staticmethod
-    def get_daily_schedule() -> List[str]:
+    def get_daily_schedule(weekday: Optional[int] = None) -> List[str]:
         """Get today's schedule.
 
+        Args:
+            weekday: Day of the week, Monday = 0 (defaults to today)
+
         Returns:
             List of schedule items
         """
-        day = datetime.now().weekday()
-
-        # Mock schedules for different days
-        if day == 0:  # Monday
-            return [
-                "7:00 AM - Wake up / Breakfast",
-                "8:00 AM - School drop-off",
-                "9:00 AM - Work from home",
-                "12:00 PM - Lunch",
-                "3:30 PM - School pickup",
-                "5:00 PM - Soccer practice (Sam)",
-                "6:30 PM - Dinner",
-                "8:00 PM - Bedtime routine"
-            ]
-        elif day == 1:  # Tuesday
-            return [
-                "7:00 AM - Wake up / Breakfast",
-                "8:00 AM - School drop-off",
-                "9:00 AM - Work from home",
-                "12:00 PM - Lunch",
-                "3:30 PM - School pickup",
-                "4:00 PM - Piano lessons (Emma)",
-                "6:00 PM - Dinner",
-                "7:30 PM - Family game night",
-                "8:30 PM - Bedtime routine"
-            ]
-        elif day == 2:  # Wednesday
-            return [
-                "7:00 AM - Wake up / Breakfast",
-                "8:00 AM - School drop-off",
-                "9:00 AM - Office day",
-                "12:30 PM - Team lunch",
-                "3:30 PM - School pickup (Grandma)",
-                "6:30 PM - Dinner",
-                "8:00 PM - Bedtime routine"
-            ]
-        elif day == 3:  # Thursday
-            return [
-                "7:00 AM - Wake up / Breakfast",
-                "8:00 AM - School drop-off",
-                "9:00 AM - Work from home",
-                "11:00 AM - Parent-teacher conference",
-                "12:00 PM - Lunch",
-                "3:30 PM - School pickup",
-                "4:30 PM - Library trip",
-                "6:00 PM - Dinner",
-                "8:00 PM - Bedtime routine"
-            ]
-        elif day == 4:  # Friday
-            return [
-                "7:00 AM - Wake up / Breakfast",
-                "8:00 AM - School drop-off",
-                "9:00 AM - Work from home",
-                "12:00 PM - Lunch",
-                "3:30 PM - School pickup",
-                "5:00 PM - Movie night prep",
-                "6:00 PM - Pizza dinner",
-                "7:00 PM - Family movie night",
-                "9:00 PM - Bedtime routine"
-            ]
-        elif day == 5:  # Saturday
-            return [
-                "8:00 AM - Weekend breakfast",
-                "9:30 AM - Soccer game (Sam)",
-                "11:00 AM - Farmers market",
-                "12:30 PM - Lunch",
-                "2:00 PM - Park / Playground",
-                "4:00 PM - Free time",
-                "6:00 PM - Dinner",
-                "8:00 PM - Bedtime routine"
-            ]
-        else:  # Sunday
-            return [
-                "8:30 AM - Weekend breakfast",
-                "10:00 AM - Family walk",
-                "11:30 AM - Meal prep",
-                "12:30 PM - Lunch",
-                "2:00 PM - Quiet time / Naps",
-                "3:30 PM - Board games",
-                "5:00 PM - Early dinner",
-                "6:00 PM - Bath time",
-                "7:30 PM - Story time",
-                "8:00 PM - Bedtime"
-            ]
+        if weekday is None:
+            weekday = datetime.now().weekday()
+        return list(_DAILY_SCHEDULES[weekday])
 
 
 class LunchMenuProvider:
     """Provides school lunch menu information."""
 
     @staticmethod
-    def get_lunch_menu() -> Optional[List[str]]:
+    def get_lunch_menu(weekday: Optional[int] = None) -> Optional[List[str]]:
         """Get today's school lunch menu.
 
+        Args:
+            weekday: Day of the week, Monday = 0 (defaults to today)
+
         Returns:
             List of menu items, or None if not a school day
         """
-        if not DateProvider.is_school_day():
-            return None
-
-        # Mock lunch menus for each weekday
-        day = datetime.now().weekday()
-        menus = {
-            0: [  # Monday
-                "Main: Chicken Nuggets",
-                "Side: Tater Tots",
-                "Vegetable: Carrots & Ranch",
-                "Fruit: Apple Slices",
-                "Drink: Milk or Juice"
-            ],
-            1: [  # Tuesday
-                "Main: Cheese Pizza",
-                "Side: Garden Salad",
-                "Vegetable: Cucumber Slices",
-                "Fruit: Orange Wedges",
-                "Drink: Milk or Juice"
-            ],
-            2: [  # Wednesday
-                "Main: Spaghetti & Meatballs",
-                "Side: Garlic Bread",
-                "Vegetable: Green Beans",
-                "Fruit: Fruit Cup",
-                "Drink: Milk or Juice"
-            ],
-            3: [  # Thursday
-                "Main: Turkey & Cheese Sandwich",
-                "Side: Pretzels",
-                "Vegetable: Baby Carrots",
-                "Fruit: Banana",
-                "Drink: Milk or Juice"
-            ],
-            4: [  # Friday
-                "Main: Fish Sticks",
-                "Side: Mac & Cheese",
-                "Vegetable: Corn",
-                "Fruit: Strawberries",
-                "Drink: Milk or Juice"
-            ]
-        }
-
-        return menus.get(day, ["Menu not available"])
+        if weekday is None:
+            weekday = datetime.now().weekday()
+        menu = _LUNCH_MENUS[weekday]
+        return list(menu) if menu is not None else None
 
 
 class DashboardDataProvider:
@@ -215,16 +229,23 @@ class DashboardDataProvider:
         self.schedule_provider = ScheduleProvider()
         self.lunch_provider = LunchMenuProvider()
 
-    def get_dashboard_data(self) -> Dict:
+    def get_dashboard_data(self, now: Optional[datetime] = None) -> Dict:
         """Get all data needed for the dashboard.
 
+        Args:
+            now: Snapshot time for the whole dashboard (defaults to the current time)
+
         Returns:
             Dictionary containing all dashboard data
         """
+        if now is None:
+            now = datetime.now()
+        weekday = now.weekday()
+
         return {
-            'date': self.date_provider.get_current_date(),
+            'date': self.date_provider.get_current_date(now),
             'weather': self.weather_provider.get_weather(),
-            'schedule': self.schedule_provider.get_daily_schedule(),
-            'lunch': self.lunch_provider.get_lunch_menu(),
-            'is_school_day': self.date_provider.is_school_day()
+            'schedule': self.schedule_provider.get_daily_schedule(weekday),
+            'lunch': self.lunch_provider.get_lunch_menu(weekday),
+            'is_school_day': self.date_provider.is_school_day(now)
         }
\ No newline at end of file
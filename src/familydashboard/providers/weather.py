@@ -1,85 +1,209 @@
 """Real weather provider using Open-Meteo API."""
 
+import numpy as np
 import requests
-from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
+import asyncio
 import logging
+import random
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Optional FlatBuffers client: smaller responses decoded straight to arrays.
+# Without it, forecasts are fetched as JSON.
+try:
+    import openmeteo_requests
+except ImportError:
+    openmeteo_requests = None
+
+# Optional faster JSON decoder for the JSON path; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Variables requested from the API. The FlatBuffers response returns them
+# by position, in this order.
+_HOURLY_VARIABLES = ('temperature_2m', 'weather_code', 'precipitation_probability')
+_DAILY_VARIABLES = ('weather_code', 'temperature_2m_max', 'temperature_2m_min',
+                    'precipitation_sum', 'precipitation_probability_max')
+_HOURLY_PARAM = ','.join(_HOURLY_VARIABLES)
+_DAILY_PARAM = ','.join(_DAILY_VARIABLES)
+
+# Per-attempt (connect, read) timeouts and retry count, kept small enough that
+# a whole retry sequence fits in OpenMeteoWeatherProvider.REQUEST_BUDGET
+_REQUEST_TIMEOUT = (3.05, 4)
+_REQUEST_RETRIES = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Forecast:
+    """A day's forecast as consumed by the dashboard.
+
+    Instances are immutable, so the provider's cache can hand the same
+    object to every caller. The text lines the dashboard renders are
+    formatted once at construction; missing values show as "N/A".
+    """
+
+    description: str = "Unknown"
+    icon: Optional[str] = None
+    weather_code: Optional[int] = None
+    temperature_high: Optional[float] = None
+    temperature_low: Optional[float] = None
+    precipitation_sum: float = 0
+    precipitation_probability: Optional[float] = None
+    hourly_temperatures: Tuple[float, ...] = ()
+    hourly_times: Tuple[int, ...] = ()
+    hourly_precipitation: Tuple[float, ...] = ()
+    unit: str = "°F"
+
+    description_str: str = field(init=False, repr=False)
+    high_str: str = field(init=False, repr=False)
+    low_str: str = field(init=False, repr=False)
+    rain_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        high, low, rain = self.temperature_high, self.temperature_low, self.precipitation_probability
+        object.__setattr__(self, 'description_str', str(self.description or "Unknown"))
+        object.__setattr__(self, 'high_str',
+                           f"High: {high:.0f}{self.unit}" if high is not None else "High: N/A")
+        object.__setattr__(self, 'low_str',
+                           f"Low: {low:.0f}{self.unit}" if low is not None else "Low: N/A")
+        object.__setattr__(self, 'rain_str', f"Rain: {rain}%" if rain is not None else "Rain: N/A")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Forecast':
+        """Build a forecast from a dictionary using the field names as keys.
+
+        Args:
+            data: Forecast dictionary; unknown keys are ignored
+
+        Returns:
+            Forecast instance
+        """
+        kwargs = {f.name: data[f.name] for f in fields(cls) if f.init and f.name in data}
+        for name in ('hourly_temperatures', 'hourly_times', 'hourly_precipitation'):
+            if name in kwargs:
+                kwargs[name] = tuple(kwargs[name])
+        return cls(**kwargs)
+
+
+# Font Awesome weather icon mappings (Standard unicode that works with FA 5/6/7)
+_WEATHER_ICONS = {
+    # WMO Weather codes to Font Awesome icons
+    0: "\uf185",    # Clear sky - sun
+    1: "\uf6c4",    # Mainly clear - cloud-sun
+    2: "\uf6c4",    # Partly cloudy - cloud-sun
+    3: "\uf0c2",    # Overcast - cloud
+    45: "\uf75f",   # Foggy - smog
+    48: "\uf75f",   # Depositing rime fog - smog
+    51: "\uf73d",   # Light drizzle - cloud-rain
+    53: "\uf73d",   # Moderate drizzle - cloud-rain
+    55: "\uf740",   # Dense drizzle - cloud-showers-heavy
+    56: "\uf73d",   # Light freezing drizzle - cloud-rain
+    57: "\uf740",   # Dense freezing drizzle - cloud-showers-heavy
+    61: "\uf73d",   # Slight rain - cloud-rain
+    63: "\uf73d",   # Moderate rain - cloud-rain
+    65: "\uf740",   # Heavy rain - cloud-showers-heavy
+    66: "\uf73d",   # Light freezing rain - cloud-rain
+    67: "\uf740",   # Heavy freezing rain - cloud-showers-heavy
+    71: "\uf2dc",   # Slight snow - snowflake
+    73: "\uf2dc",   # Moderate snow - snowflake
+    75: "\uf2dc",   # Heavy snow - snowflake
+    77: "\uf2dc",   # Snow grains - snowflake
+    80: "\uf73d",   # Slight rain showers - cloud-rain
+    81: "\uf73d",   # Moderate rain showers - cloud-rain
+    82: "\uf740",   # Violent rain showers - cloud-showers-heavy
+    85: "\uf2dc",   # Slight snow showers - snowflake
+    86: "\uf2dc",   # Heavy snow showers - snowflake
+    95: "\uf0e7",   # Thunderstorm - bolt
+    96: "\uf0e7",   # Thunderstorm with slight hail - bolt
+    99: "\uf0e7",   # Thunderstorm with heavy hail - bolt
+}
+
+# Weather code descriptions
+_WEATHER_DESCRIPTIONS = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    56: "Light freezing drizzle",
+    57: "Dense freezing drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    66: "Light freezing rain",
+    67: "Heavy freezing rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail",
+}
+
+# WMO codes are all below 100, so index flat tables by code instead of hashing
+_WMO_CODE_LIMIT = 100
+_DEFAULT_ICON = "\uf185"  # sun
+_DEFAULT_DESCRIPTION = "Unknown"
+_ICON_TABLE = tuple(_WEATHER_ICONS.get(code, _DEFAULT_ICON) for code in range(_WMO_CODE_LIMIT))
+_DESCRIPTION_TABLE = tuple(_WEATHER_DESCRIPTIONS.get(code, _DEFAULT_DESCRIPTION)
+                           for code in range(_WMO_CODE_LIMIT))
+
+
+def _lookup_code(table: Tuple[str, ...], weather_code, default: str) -> str:
+    """Look up a WMO code in a code-indexed table.
+
+    Args:
+        table: Table indexed by weather code
+        weather_code: WMO weather code; may be a float or None from the API
+        default: Value for missing, null or out-of-range codes
+
+    Returns:
+        Table entry for the code, or default
+    """
+    try:
+        code = int(weather_code)
+    except (TypeError, ValueError):  # None or NaN
+        return default
+    return table[code] if 0 <= code < _WMO_CODE_LIMIT else default
+
 
 class OpenMeteoWeatherProvider:
     """Weather provider using Open-Meteo free weather API."""
 
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
-    # Font Awesome weather icon mappings (Standard unicode that works with FA 5/6/7)
-    WEATHER_ICONS = {
-        # WMO Weather codes to Font Awesome icons
-        0: "\uf185",    # Clear sky - sun
-        1: "\uf6c4",    # Mainly clear - cloud-sun
-        2: "\uf6c4",    # Partly cloudy - cloud-sun
-        3: "\uf0c2",    # Overcast - cloud
-        45: "\uf75f",   # Foggy - smog
-        48: "\uf75f",   # Depositing rime fog - smog
-        51: "\uf73d",   # Light drizzle - cloud-rain
-        53: "\uf73d",   # Moderate drizzle - cloud-rain
-        55: "\uf740",   # Dense drizzle - cloud-showers-heavy
-        56: "\uf73d",   # Light freezing drizzle - cloud-rain
-        57: "\uf740",   # Dense freezing drizzle - cloud-showers-heavy
-        61: "\uf73d",   # Slight rain - cloud-rain
-        63: "\uf73d",   # Moderate rain - cloud-rain
-        65: "\uf740",   # Heavy rain - cloud-showers-heavy
-        66: "\uf73d",   # Light freezing rain - cloud-rain
-        67: "\uf740",   # Heavy freezing rain - cloud-showers-heavy
-        71: "\uf2dc",   # Slight snow - snowflake
-        73: "\uf2dc",   # Moderate snow - snowflake
-        75: "\uf2dc",   # Heavy snow - snowflake
-        77: "\uf2dc",   # Snow grains - snowflake
-        80: "\uf73d",   # Slight rain showers - cloud-rain
-        81: "\uf73d",   # Moderate rain showers - cloud-rain
-        82: "\uf740",   # Violent rain showers - cloud-showers-heavy
-        85: "\uf2dc",   # Slight snow showers - snowflake
-        86: "\uf2dc",   # Heavy snow showers - snowflake
-        95: "\uf0e7",   # Thunderstorm - bolt
-        96: "\uf0e7",   # Thunderstorm with slight hail - bolt
-        99: "\uf0e7",   # Thunderstorm with heavy hail - bolt
-    }
-
-    # Weather code descriptions
-    WEATHER_DESCRIPTIONS = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Foggy",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        56: "Light freezing drizzle",
-        57: "Dense freezing drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        66: "Light freezing rain",
-        67: "Heavy freezing rain",
-        71: "Slight snow",
-        73: "Moderate snow",
-        75: "Heavy snow",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-    }
+    # Worst-case seconds for one fetch including retries, for callers that
+    # wait on a fetch with a timeout
+    REQUEST_BUDGET = (_REQUEST_RETRIES + 1) * sum(_REQUEST_TIMEOUT) + 1
+
+    # WMO code tables as read-only views: one shared copy that callers and
+    # threads can't mutate
+    WEATHER_ICONS = MappingProxyType(_WEATHER_ICONS)
+    WEATHER_DESCRIPTIONS = MappingProxyType(_WEATHER_DESCRIPTIONS)
 
     def __init__(self, latitude: float = 40.7128, longitude: float = -74.0060,
-                 timezone_str: str = "America/New_York", temperature_unit: str = "fahrenheit"):
+                 timezone_str: str = "America/New_York", temperature_unit: str = "fahrenheit",
+                 ttl_seconds: Optional[float] = None, max_stale_seconds: float = 7200):
         """Initialize the weather provider.
 
         Args:
@@ -87,73 +211,281 @@ class OpenMeteoWeatherProvider:
             longitude: Location longitude (default: NYC)
             timezone_str: Timezone string (default: America/New_York)
             temperature_unit: celsius or fahrenheit (default: fahrenheit)
+            ttl_seconds: How long a fetched forecast is reused (default: until
+                just after the next top of the hour, when Open-Meteo refreshes)
+            max_stale_seconds: How long past that an expired forecast is still
+                served while a background refresh runs (default: 2 hours)
         """
         self.latitude = latitude
         self.longitude = longitude
         self.timezone = timezone_str
         self.temperature_unit = temperature_unit
 
-    def get_daily_forecast(self) -> Optional[Dict]:
-        """Fetch daily weather forecast with hourly data.
+        # Query parameters and unit label, built once and only rebuilt if the
+        # location or unit attributes are changed (see _request_params)
+        self._params_key: Optional[Tuple] = None
+        self._params: Dict = {}
+        self._unit_label = ''
+        self._request_params()
+
+        # Successful forecasts by request key -> (stale after, hard expiry,
+        # forecast), in time.monotonic() seconds. Open-Meteo only refreshes
+        # hourly, so fresh hits skip the network; stale ones are served while
+        # a refresh runs in the background.
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._cache: Dict[Tuple, Tuple[float, float, Forecast]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Single-flight bookkeeping (guarded by _cache_lock): a refresh in
+        # progress per key, and its result for the callers waiting on it
+        self._inflight: Dict[Tuple, threading.Event] = {}
+        self._inflight_result: Dict[Tuple, Optional[Forecast]] = {}
+
+        # One pooled session so later fetches reuse the kept-alive TLS
+        # connection; transient gateway errors are retried with backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=_REQUEST_RETRIES, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self._session.mount("https://", adapter)
+
+        # FlatBuffers client on the same session and retry policy, when installed
+        self._om_client = (openmeteo_requests.Client(session=self._session)
+                           if openmeteo_requests is not None else None)
+
+        # Validators from the last JSON response, for conditional requests:
+        # (query, ETag, Last-Modified, parsed payload)
+        self._conditional: Optional[Tuple[Tuple, Optional[str], Optional[str], List[Tuple[Dict, Dict]]]] = None
+
+    def _request_params(self) -> Dict:
+        """Get the API query parameters for the current location and unit.
 
         Returns:
-            Dictionary with weather data including hourly temperatures for graphing
+            Query parameter dictionary (shared; do not modify)
         """
-        try:
-            params = {
+        key = (self.latitude, self.longitude, self.timezone, self.temperature_unit)
+        if key != self._params_key:
+            self._params = {
                 'latitude': self.latitude,
                 'longitude': self.longitude,
-                'hourly': 'temperature_2m,weather_code,precipitation_probability',
-                'daily': 'weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_probability_max',
+                'hourly': _HOURLY_PARAM,
+                'daily': _DAILY_PARAM,
                 'temperature_unit': self.temperature_unit,
                 'timezone': self.timezone,
                 'forecast_days': 1
             }
+            self._unit_label = '°F' if self.temperature_unit == 'fahrenheit' else '°C'
+            self._params_key = key
+        return self._params
 
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Process the data
-            hourly_data = data.get('hourly', {})
-            daily_data = data.get('daily', {})
-
-            # Get today's data
-            today_weather_code = daily_data['weather_code'][0] if daily_data.get('weather_code') else 0
-
-            # Extract hourly temperatures for today (24 hours)
-            hourly_temps = hourly_data.get('temperature_2m', [])[:24]
-            hourly_times = hourly_data.get('time', [])[:24]
-            hourly_weather_codes = hourly_data.get('weather_code', [])[:24]
-            hourly_precip_prob = hourly_data.get('precipitation_probability', [])[:24]
-
-            # Convert times to hour labels
-            hours = []
-            for time_str in hourly_times:
-                dt = datetime.fromisoformat(time_str)
-                hours.append(dt.hour)
-
-            # Find the predominant weather condition for the day
-            if hourly_weather_codes:
-                # Use the most common weather code during daylight hours (6am-6pm)
-                daylight_codes = hourly_weather_codes[6:18] if len(hourly_weather_codes) > 18 else hourly_weather_codes
-                most_common_code = max(set(daylight_codes), key=daylight_codes.count) if daylight_codes else today_weather_code
-            else:
-                most_common_code = today_weather_code
-
-            return {
-                'weather_code': most_common_code,
-                'description': self.WEATHER_DESCRIPTIONS.get(most_common_code, "Unknown"),
-                'icon': self.WEATHER_ICONS.get(most_common_code, "\uf185"),  # Default to sun
-                'temperature_high': daily_data['temperature_2m_max'][0] if daily_data.get('temperature_2m_max') else None,
-                'temperature_low': daily_data['temperature_2m_min'][0] if daily_data.get('temperature_2m_min') else None,
-                'precipitation_sum': daily_data['precipitation_sum'][0] if daily_data.get('precipitation_sum') else 0,
-                'precipitation_probability': daily_data['precipitation_probability_max'][0] if daily_data.get('precipitation_probability_max') else 0,
-                'hourly_temperatures': hourly_temps,
-                'hourly_times': hours,
-                'hourly_precipitation': hourly_precip_prob,
-                'unit': '°F' if self.temperature_unit == 'fahrenheit' else '°C'
-            }
+    def _cache_key(self) -> Tuple:
+        """Get the cache and single-flight key for the current location and unit.
+
+        Returns:
+            Tuple of (latitude, longitude, timezone, temperature unit)
+        """
+        return (self.latitude, self.longitude, self.timezone, self.temperature_unit)
+
+    def _cache_expiry(self) -> float:
+        """Get the time.monotonic() deadline for a forecast fetched now.
+
+        Returns:
+            Fixed TTL from now if ttl_seconds is set, otherwise the next top
+            of the hour plus up to a minute of jitter so dashboards sharing
+            the upstream don't all refetch at once
+        """
+        now = time.monotonic()
+        if self.ttl_seconds is not None:
+            return now + self.ttl_seconds
+        wall = datetime.now(timezone.utc)
+        next_hour = wall.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        return now + (next_hour - wall).total_seconds() + random.uniform(0, 60)
+
+    def _cache_entry(self, forecast: Forecast) -> Tuple[float, float, Forecast]:
+        """Build the cache entry for a forecast fetched now.
+
+        Args:
+            forecast: Freshly fetched forecast
+
+        Returns:
+            Tuple of (stale after, hard expiry, forecast)
+        """
+        stale_after = self._cache_expiry()
+        return stale_after, stale_after + self.max_stale_seconds, forecast
+
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def get_daily_forecast(self) -> Optional[Forecast]:
+        """Get the daily weather forecast with hourly data, served from cache when possible.
+
+        Returns:
+            Forecast including hourly temperatures for graphing, or None if
+            the request failed
+        """
+        key = self._cache_key()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            # The deadlines are only set on insert, so hits never extend an entry
+            if entry is not None and now < entry[0]:
+                return entry[2]
+
+            # Only one refresh per key runs at a time
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+
+            # Stale but usable: answer now and refresh in the background
+            if entry is not None and now < entry[1]:
+                if leader:
+                    threading.Thread(target=self._refresh, args=(key, event), daemon=True).start()
+                return entry[2]
+
+        # Nothing usable cached: wait for the refresh, ours or another caller's
+        if not leader:
+            event.wait()
+            return self._inflight_result.get(key)
+        return self._refresh(key, event)
+
+    def _refresh(self, key: Tuple, event: threading.Event) -> Optional[Forecast]:
+        """Fetch a forecast for a key this caller has claimed in _inflight.
+
+        Args:
+            key: Cache key being refreshed
+            event: The key's in-flight event, set once the result is published
+
+        Returns:
+            Forecast, or None if the request failed
+        """
+        forecast = None
+        try:
+            forecast = self._fetch_daily_forecast()
+        finally:
+            self._publish(key, event, forecast)
+
+        return forecast
+
+    def _publish(self, key: Tuple, event: threading.Event, forecast: Optional[Forecast]):
+        """Finish a claimed refresh: cache the result and wake its waiters.
+
+        Args:
+            key: Cache key that was refreshed
+            event: The key's in-flight event
+            forecast: Fetched forecast, or None if the fetch failed
+        """
+        with self._cache_lock:
+            if forecast is not None:
+                self._cache[key] = self._cache_entry(forecast)
+            # Waiters read the result after set(); it stays until the next
+            # refresh of this key replaces it
+            self._inflight_result[key] = forecast
+            del self._inflight[key]
+        event.set()
+
+    @classmethod
+    def fetch_many(cls, providers: List['OpenMeteoWeatherProvider']) -> List[Optional[Forecast]]:
+        """Fetch forecasts for several locations in one request per temperature unit.
+
+        Open-Meteo accepts comma-separated coordinates and timezones, so a
+        household with several locations pays for one round trip instead of
+        one per provider. Fresh cache entries are reused, locations another
+        caller is already refreshing are waited on rather than fetched again,
+        and each new forecast is published to its provider's cache.
+
+        Args:
+            providers: Providers whose locations to fetch
+
+        Returns:
+            Forecasts in the same order as providers; None where a fetch failed
+        """
+        results: List[Optional[Forecast]] = [None] * len(providers)
+        claimed: List[Tuple[int, 'OpenMeteoWeatherProvider', Tuple, threading.Event]] = []
+        waiting: List[Tuple[int, 'OpenMeteoWeatherProvider', Tuple, threading.Event]] = []
+
+        for i, provider in enumerate(providers):
+            key = provider._cache_key()
+            with provider._cache_lock:
+                entry = provider._cache.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    results[i] = entry[2]
+                    continue
+                event = provider._inflight.get(key)
+                if event is not None:
+                    waiting.append((i, provider, key, event))
+                    continue
+                event = provider._inflight[key] = threading.Event()
+            claimed.append((i, provider, key, event))
+
+        fetched: Dict[int, Optional[Forecast]] = {}
+        try:
+            # The unit is a single query parameter, so group by it
+            groups: Dict[str, List[Tuple[int, 'OpenMeteoWeatherProvider']]] = {}
+            for i, provider, _, _ in claimed:
+                groups.setdefault(provider.temperature_unit, []).append((i, provider))
+
+            for members in groups.values():
+                # Refresh every member's params, which also refreshes its unit label
+                member_params = [provider._request_params() for _, provider in members]
+                params = dict(member_params[0])
+                params['latitude'] = ','.join(str(p['latitude']) for p in member_params)
+                params['longitude'] = ','.join(str(p['longitude']) for p in member_params)
+                params['timezone'] = ','.join(p['timezone'] for p in member_params)
+
+                # The first member's session and FlatBuffers client serve the
+                # whole group. Its ETag state belongs to its own single-location
+                # query, so the batched query is sent unconditionally.
+                try:
+                    payloads = members[0][1]._request_locations(params, revalidate=False)
+                except Exception as e:
+                    logger.error(f"Failed to fetch weather data: {e}")
+                    continue
+
+                for (i, provider), payload in zip(members, payloads):
+                    try:
+                        fetched[i] = provider._build_forecast(*payload)
+                    except Exception as e:
+                        logger.error(f"Error processing weather data: {e}")
+        finally:
+            for i, provider, key, event in claimed:
+                results[i] = fetched.get(i)
+                provider._publish(key, event, results[i])
+
+        # Only wait once our own claims are published, in case a provider
+        # appears more than once in the batch
+        for i, provider, key, event in waiting:
+            event.wait()
+            results[i] = provider._inflight_result.get(key)
+
+        return results
+
+    async def get_daily_forecast_async(self) -> Optional[Forecast]:
+        """Async variant of get_daily_forecast for use alongside other providers.
+
+        The blocking fetch runs in a worker thread, so it shares the pooled
+        session and the TTL cache with the sync method.
+
+        Returns:
+            Forecast including hourly temperatures for graphing, or None if
+            the request failed
+        """
+        return await asyncio.to_thread(self.get_daily_forecast)
+
+    def _fetch_daily_forecast(self) -> Optional[Forecast]:
+        """Fetch daily weather forecast with hourly data from the API.
+
+        Returns:
+            Forecast, or None if the request failed
+        """
+        try:
+            hourly_data, daily_data = self._request_locations(self._request_params())[0]
+            return self._build_forecast(hourly_data, daily_data)
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch weather data: {e}")
@@ -162,6 +494,167 @@ class OpenMeteoWeatherProvider:
             logger.error(f"Error processing weather data: {e}")
             return None
 
+    def _build_forecast(self, hourly_data: Dict, daily_data: Dict) -> Forecast:
+        """Reduce one location's hourly and daily series to a Forecast.
+
+        Args:
+            hourly_data: Hourly series by variable name
+            daily_data: Daily series by variable name
+
+        Returns:
+            Forecast for today
+        """
+        # Get today's data
+        today_weather_code = daily_data['weather_code'][0] if daily_data.get('weather_code') else 0
+
+        # Extract hourly data for today (24 hours) as arrays; nulls become NaN
+        hourly_temps = np.asarray(hourly_data.get('temperature_2m', [])[:24], dtype=np.float64)
+        # With forecast_days=1 in the local timezone the series is today's
+        # hours from midnight, so the hour labels are just the indices unless
+        # the request path supplied explicit ones
+        if 'hour' in hourly_data:
+            hours = np.asarray(hourly_data['hour'][:24], dtype=np.intp)
+        else:
+            hours = np.arange(hourly_temps.size)
+        hourly_weather_codes = np.asarray(hourly_data.get('weather_code', [])[:24], dtype=np.float64)
+        hourly_precip_prob = np.asarray(hourly_data.get('precipitation_probability', [])[:24], dtype=np.float64)
+
+        # Find the predominant weather condition for the day: the most
+        # common code during daylight hours (6am-6pm)
+        daylight_codes = hourly_weather_codes[6:18] if hourly_weather_codes.size > 18 else hourly_weather_codes
+        daylight_codes = daylight_codes[~np.isnan(daylight_codes)].astype(np.intp)
+        if daylight_codes.size:
+            most_common_code = int(np.bincount(daylight_codes).argmax())
+        else:
+            most_common_code = today_weather_code
+
+        return Forecast(
+            weather_code=most_common_code,
+            description=self.get_weather_description(most_common_code),
+            icon=self.get_weather_icon(most_common_code),
+            temperature_high=daily_data['temperature_2m_max'][0] if daily_data.get('temperature_2m_max') else None,
+            temperature_low=daily_data['temperature_2m_min'][0] if daily_data.get('temperature_2m_min') else None,
+            precipitation_sum=daily_data['precipitation_sum'][0] if daily_data.get('precipitation_sum') else 0,
+            precipitation_probability=daily_data['precipitation_probability_max'][0] if daily_data.get('precipitation_probability_max') else 0,
+            hourly_temperatures=tuple(hourly_temps.tolist()),
+            hourly_times=tuple(hours.tolist()),
+            hourly_precipitation=tuple(hourly_precip_prob.tolist()),
+            unit=self._unit_label
+        )
+
+    def _request_locations(self, params: Dict, revalidate: bool = True) -> List[Tuple[Dict, Dict]]:
+        """Request forecasts over FlatBuffers if available, otherwise JSON.
+
+        Args:
+            params: Query parameters; latitude/longitude/timezone may list
+                several comma-separated locations
+            revalidate: Whether a JSON request may use and update this
+                provider's ETag state
+
+        Returns:
+            List of (hourly, daily) series by variable name, one per location
+        """
+        if self._om_client is not None:
+            return self._request_flatbuffers(params)
+        return self._request_json(params, revalidate)
+
+    def _request_json(self, params: Dict, revalidate: bool = True) -> List[Tuple[Dict, Dict]]:
+        """Request the forecast as JSON.
+
+        Args:
+            params: Query parameters
+            revalidate: Whether to send and store conditional request
+                validators; off for queries that are not this provider's own
+
+        Returns:
+            List of (hourly, daily) series by variable name, one per location
+        """
+        # Revalidate the previous response for the same query; an unchanged
+        # forecast comes back as a bodiless 304
+        query = tuple(sorted(params.items()))
+        headers = {}
+        if revalidate and self._conditional is not None and self._conditional[0] == query:
+            _, etag, last_modified, payload = self._conditional
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = self._session.get(self.BASE_URL, params=params, headers=headers,
+                                     timeout=_REQUEST_TIMEOUT)
+        if response.status_code == 304 and headers:
+            return payload
+        response.raise_for_status()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+
+        # One location comes back as an object, several as a list
+        if isinstance(data, dict):
+            data = [data]
+
+        payloads = []
+        for location in data:
+            hourly_data = location.get('hourly', {})
+
+            # _build_forecast labels hours by position, which holds when the
+            # series runs from local midnight to 23:00. Otherwise (e.g. a DST
+            # changeover day) read the labels from the timestamps instead.
+            times = hourly_data.get('time') or []
+            if times and not (times[0][11:16] == '00:00' and len(times) >= 24
+                              and times[23][11:13] == '23'):
+                logger.warning("Hourly series is not midnight-aligned; using its timestamps")
+                times = times[:24]
+                try:
+                    hourly_data['hour'] = [int(time_str[11:13]) for time_str in times]
+                except ValueError:
+                    hourly_data['hour'] = [datetime.fromisoformat(time_str).hour for time_str in times]
+
+            payloads.append((hourly_data, location.get('daily', {})))
+
+        if not revalidate:
+            return payloads
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._conditional = (query, etag, last_modified, payloads)
+        else:
+            self._conditional = None
+
+        return payloads
+
+    def _request_flatbuffers(self, params: Dict) -> List[Tuple[Dict, Dict]]:
+        """Request the forecast in Open-Meteo's FlatBuffers format.
+
+        Args:
+            params: Query parameters
+
+        Returns:
+            List of (hourly, daily) series by variable name, one per
+            location, shaped like the JSON path's output
+        """
+        payloads = []
+        # The client adds format=flatbuffers to the dict it is given, and
+        # params may be the provider's shared query dict
+        for response in self._om_client.weather_api(self.BASE_URL, params=dict(params),
+                                                    timeout=_REQUEST_TIMEOUT):
+            hourly = response.Hourly()
+            hourly_data = {name: hourly.Variables(i).ValuesAsNumpy()
+                           for i, name in enumerate(_HOURLY_VARIABLES)}
+
+            # Daily values end up in formatted text, so hand them over as Python
+            # numbers; codes and probabilities are whole numbers sent as float.
+            # Missing values arrive as NaN and become None, like JSON nulls.
+            daily = response.Daily()
+            daily_data = {}
+            for i, name in enumerate(_DAILY_VARIABLES):
+                whole = name.startswith(('weather_code', 'precipitation_probability'))
+                daily_data[name] = [None if np.isnan(value) else int(value) if whole else value
+                                    for value in daily.Variables(i).ValuesAsNumpy().tolist()]
+
+            payloads.append((hourly_data, daily_data))
+
+        return payloads
+
     def get_weather_icon(self, weather_code: int) -> str:
         """Get Font Awesome icon for weather code.
 
@@ -171,4 +664,16 @@ class OpenMeteoWeatherProvider:
         Returns:
             Font Awesome unicode character
         """
-        return self.WEATHER_ICONS.get(weather_code, "\uf185")  # Default to sun
\ No newline at end of file
+        return _lookup_code(_ICON_TABLE, weather_code, _DEFAULT_ICON)
+
+    def get_weather_description(self, weather_code: int) -> str:
+        """Get a human-readable description for weather code.
+
+        Args:
+            weather_code: WMO weather code
+
+        Returns:
+            Description, or "Unknown" for unrecognized codes
+        """
+        return _lookup_code(_DESCRIPTION_TABLE, weather_code, _DEFAULT_DESCRIPTION)
+
@@ -0,0 +1,34 @@
+"""Tests for the temperature graph component."""
+
+import math
+from datetime import datetime
+
+import numpy as np
+
+from familydashboard.components.weather_graph import TemperatureGraph
+
+
+def test_fast_graph_skips_missing_hour():
+    """A missing (NaN) hour is left out instead of breaking the render."""
+    hours = list(range(24))
+    temperatures = [50.0 + hour for hour in hours]
+    temperatures[14] = math.nan
+
+    graph = TemperatureGraph(width=700, height=200).create_simple_graph_fast(
+        hours, temperatures, now=datetime(2026, 10, 12, 14, 5))
+
+    assert graph.size == (700, 200)
+    pixels = np.asarray(graph)
+    # The line is still drawn from the remaining hours
+    assert (pixels == 0).all(axis=2).sum() > 0
+    # The current hour has no temperature, so no marker is drawn for it
+    assert not (pixels == (255, 0, 0)).all(axis=2).any()
+
+
+def test_fast_graph_without_temperatures_is_blank():
+    """A day with no temperatures at all renders an empty graph."""
+    graph = TemperatureGraph(width=700, height=200).create_simple_graph_fast(
+        list(range(24)), [None] * 24)
+
+    assert graph.size == (700, 200)
+    assert (np.asarray(graph) == 255).all()